@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, pool
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.config.settings import get_settings
 from app.db.base import Base
@@ -29,7 +31,7 @@ def get_url() -> str:
 
 
 def get_sync_url() -> str:
-    """Convert async driver URLs to sync equivalents for Alembic."""
+    """Convert async driver URLs to sync equivalents for offline SQL rendering."""
     url = get_url()
     # aiosqlite → plain sqlite
     url = url.replace("+aiosqlite", "")
@@ -50,7 +52,7 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def do_run_migrations(connection):  # type: ignore[no-untyped-def]
+def do_run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
@@ -60,12 +62,18 @@ def do_run_migrations(connection):  # type: ignore[no-untyped-def]
         context.run_migrations()
 
 
+async def run_async_migrations() -> None:
+    """Run migrations over the application's own async driver."""
+    engine = create_async_engine(get_url(), poolclass=pool.NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
 def run_migrations_online() -> None:
-    """Run migrations using a synchronous engine (safe from any context)."""
-    engine = create_engine(get_sync_url())
-    with engine.connect() as connection:
-        do_run_migrations(connection)
-    engine.dispose()
+    # Must not be called from a running event loop; the app runs
+    # `alembic upgrade` in a worker thread at startup.
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
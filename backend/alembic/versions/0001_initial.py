@@ -7,30 +7,45 @@ Create Date: 2026-02-24
 
 from __future__ import annotations
 
+import uuid
+from datetime import UTC, datetime
+
 import sqlalchemy as sa
-from alembic import op
+from alembic import context, op
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 revision: str = "0001_initial"
 down_revision: str | None = None
 branch_labels: str | None = None
 depends_on: str | None = None
 
+# Mirrors app.db.models.user.RoleEnum at the time of this revision
+_DEFAULT_ROLES = ("admin", "editor", "reviewer", "viewer")
+
 
 def upgrade() -> None:
+    # Declare the whole schema on a local MetaData and emit it with a single
+    # create_all() inside the migration transaction, rather than one op call
+    # per table/index. The metadata is a frozen snapshot of the initial
+    # schema; it deliberately does not import the live models.
+    metadata = sa.MetaData()
+
     # roles
-    op.create_table(
+    roles = sa.Table(
         "roles",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("name", sa.String(50), nullable=False, unique=True),
         sa.Column("description", sa.String(255), nullable=False, default=""),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_roles_name", "name"),
     )
-    op.create_index("ix_roles_name", "roles", ["name"])
 
     # users
-    op.create_table(
+    sa.Table(
         "users",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("username", sa.String(100), nullable=False),
         sa.Column("email", sa.String(255), nullable=True),
@@ -41,15 +56,16 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
         sa.UniqueConstraint("username", name="uq_users_username"),
+        sa.Index("ix_users_username", "username"),
+        sa.Index("ix_users_email", "email"),
+        sa.Index("ix_users_role_id", "role_id"),
+        sa.Index("ix_users_deleted_at", "deleted_at"),
     )
-    op.create_index("ix_users_username", "users", ["username"])
-    op.create_index("ix_users_email", "users", ["email"])
-    op.create_index("ix_users_role_id", "users", ["role_id"])
-    op.create_index("ix_users_deleted_at", "users", ["deleted_at"])
 
     # documents
-    op.create_table(
+    sa.Table(
         "documents",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("filename", sa.String(500), nullable=False),
         sa.Column("original_filename", sa.String(500), nullable=False),
@@ -63,14 +79,15 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Index("ix_documents_file_hash", "file_hash"),
+        sa.Index("ix_documents_status", "status"),
+        sa.Index("ix_documents_deleted_at", "deleted_at"),
     )
-    op.create_index("ix_documents_file_hash", "documents", ["file_hash"])
-    op.create_index("ix_documents_status", "documents", ["status"])
-    op.create_index("ix_documents_deleted_at", "documents", ["deleted_at"])
 
     # sections
-    op.create_table(
+    sa.Table(
         "sections",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("document_id", sa.String(36), sa.ForeignKey("documents.id", ondelete="CASCADE"), nullable=False),
         sa.Column("parent_id", sa.String(36), sa.ForeignKey("sections.id", ondelete="SET NULL"), nullable=True),
@@ -85,15 +102,16 @@ def upgrade() -> None:
         sa.Column("char_count", sa.Integer, nullable=False, default=0),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_sections_document_id", "document_id"),
+        sa.Index("ix_sections_parent_id", "parent_id"),
+        sa.Index("ix_sections_content_hash", "content_hash"),
+        sa.Index("ix_sections_section_type", "section_type"),
     )
-    op.create_index("ix_sections_document_id", "sections", ["document_id"])
-    op.create_index("ix_sections_parent_id", "sections", ["parent_id"])
-    op.create_index("ix_sections_content_hash", "sections", ["content_hash"])
-    op.create_index("ix_sections_section_type", "sections", ["section_type"])
 
     # rulesets
-    op.create_table(
+    sa.Table(
         "rulesets",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("name", sa.String(255), nullable=False),
         sa.Column("description", sa.Text, nullable=False),
@@ -108,14 +126,15 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
         sa.UniqueConstraint("name", "version", name="uq_rulesets_name_version"),
+        sa.Index("ix_rulesets_name", "name"),
+        sa.Index("ix_rulesets_is_active", "is_active"),
+        sa.Index("ix_rulesets_jurisdiction", "jurisdiction"),
     )
-    op.create_index("ix_rulesets_name", "rulesets", ["name"])
-    op.create_index("ix_rulesets_is_active", "rulesets", ["is_active"])
-    op.create_index("ix_rulesets_jurisdiction", "rulesets", ["jurisdiction"])
 
     # rule_conflicts
-    op.create_table(
+    sa.Table(
         "rule_conflicts",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("ruleset_id", sa.String(36), sa.ForeignKey("rulesets.id", ondelete="CASCADE"), nullable=False),
         sa.Column("rule_a_id", sa.String(255), nullable=False),
@@ -124,12 +143,13 @@ def upgrade() -> None:
         sa.Column("is_resolved", sa.Boolean, nullable=False, default=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_rule_conflicts_ruleset_id", "ruleset_id"),
     )
-    op.create_index("ix_rule_conflicts_ruleset_id", "rule_conflicts", ["ruleset_id"])
 
     # rewrite_jobs
-    op.create_table(
+    sa.Table(
         "rewrite_jobs",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("document_id", sa.String(36), sa.ForeignKey("documents.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("ruleset_id", sa.String(36), sa.ForeignKey("rulesets.id", ondelete="RESTRICT"), nullable=False),
@@ -140,14 +160,15 @@ def upgrade() -> None:
         sa.Column("completed_sections", sa.Integer, nullable=False, default=0),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_rewrite_jobs_document_id", "document_id"),
+        sa.Index("ix_rewrite_jobs_status", "status"),
+        sa.Index("ix_rewrite_jobs_created_by", "created_by"),
     )
-    op.create_index("ix_rewrite_jobs_document_id", "rewrite_jobs", ["document_id"])
-    op.create_index("ix_rewrite_jobs_status", "rewrite_jobs", ["status"])
-    op.create_index("ix_rewrite_jobs_created_by", "rewrite_jobs", ["created_by"])
 
     # section_rewrites
-    op.create_table(
+    sa.Table(
         "section_rewrites",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("job_id", sa.String(36), sa.ForeignKey("rewrite_jobs.id", ondelete="CASCADE"), nullable=False),
         sa.Column("section_id", sa.String(36), sa.ForeignKey("sections.id", ondelete="RESTRICT"), nullable=False),
@@ -164,14 +185,15 @@ def upgrade() -> None:
         sa.Column("error_message", sa.Text, nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_section_rewrites_job_id", "job_id"),
+        sa.Index("ix_section_rewrites_section_id", "section_id"),
+        sa.Index("ix_section_rewrites_status", "status"),
     )
-    op.create_index("ix_section_rewrites_job_id", "section_rewrites", ["job_id"])
-    op.create_index("ix_section_rewrites_section_id", "section_rewrites", ["section_id"])
-    op.create_index("ix_section_rewrites_status", "section_rewrites", ["status"])
 
     # risk_findings
-    op.create_table(
+    sa.Table(
         "risk_findings",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("rewrite_id", sa.String(36), sa.ForeignKey("section_rewrites.id", ondelete="CASCADE"), nullable=False),
         sa.Column("severity", sa.String(20), nullable=False),
@@ -181,13 +203,14 @@ def upgrade() -> None:
         sa.Column("detail_json", sa.Text, nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_risk_findings_rewrite_id", "rewrite_id"),
+        sa.Index("ix_risk_findings_severity", "severity"),
     )
-    op.create_index("ix_risk_findings_rewrite_id", "risk_findings", ["rewrite_id"])
-    op.create_index("ix_risk_findings_severity", "risk_findings", ["severity"])
 
     # reviews
-    op.create_table(
+    sa.Table(
         "reviews",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("rewrite_id", sa.String(36), sa.ForeignKey("section_rewrites.id", ondelete="RESTRICT"), nullable=False, unique=True),
         sa.Column("reviewer_id", sa.String(36), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
@@ -197,14 +220,15 @@ def upgrade() -> None:
         sa.Column("risk_override_reason", sa.Text, nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_reviews_rewrite_id", "rewrite_id"),
+        sa.Index("ix_reviews_reviewer_id", "reviewer_id"),
+        sa.Index("ix_reviews_status", "status"),
     )
-    op.create_index("ix_reviews_rewrite_id", "reviews", ["rewrite_id"])
-    op.create_index("ix_reviews_reviewer_id", "reviews", ["reviewer_id"])
-    op.create_index("ix_reviews_status", "reviews", ["status"])
 
     # review_comments
-    op.create_table(
+    sa.Table(
         "review_comments",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("review_id", sa.String(36), sa.ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False),
         sa.Column("parent_comment_id", sa.String(36), sa.ForeignKey("review_comments.id", ondelete="SET NULL"), nullable=True),
@@ -214,12 +238,13 @@ def upgrade() -> None:
         sa.Column("is_resolved", sa.Boolean, nullable=False, default=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Index("ix_review_comments_review_id", "review_id"),
     )
-    op.create_index("ix_review_comments_review_id", "review_comments", ["review_id"])
 
     # audit_events
-    op.create_table(
+    sa.Table(
         "audit_events",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("event_type", sa.String(100), nullable=False),
         sa.Column("actor_id", sa.String(36), nullable=True),
@@ -233,14 +258,36 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
         sa.UniqueConstraint("event_hash", name="uq_audit_event_hash"),
+        sa.Index("ix_audit_events_event_type", "event_type"),
+        sa.Index("ix_audit_events_actor_id", "actor_id"),
+        sa.Index("ix_audit_events_correlation_id", "correlation_id"),
+        sa.Index("ix_audit_events_actor_entity", "actor_id", "entity_type", "entity_id"),
     )
-    op.create_index("ix_audit_events_event_type", "audit_events", ["event_type"])
-    op.create_index("ix_audit_events_actor_id", "audit_events", ["actor_id"])
-    op.create_index("ix_audit_events_correlation_id", "audit_events", ["correlation_id"])
-    op.create_index(
-        "ix_audit_events_actor_entity",
-        "audit_events",
-        ["actor_id", "entity_type", "entity_id"],
+
+    if context.is_offline_mode():
+        # --sql has no live bind; render the same DDL into the script
+        for table in metadata.sorted_tables:
+            op.execute(CreateTable(table))
+            for index in sorted(table.indexes, key=lambda i: i.name or ""):
+                op.execute(CreateIndex(index))
+    else:
+        metadata.create_all(op.get_bind(), checkfirst=False)
+
+    # Seed the default roles in one multi-row INSERT; the startup seeder
+    # then finds them present and only bootstraps the admin user
+    now = datetime.now(UTC)
+    op.bulk_insert(
+        roles,
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "name": name,
+                "description": f"{name} role",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for name in _DEFAULT_ROLES
+        ],
     )
 
 
@@ -0,0 +1,27 @@
+"""Add composite (created_at, id) index backing keyset pagination of audit events.
+
+Revision ID: 0003_audit_keyset_index
+Revises: bf4d55615c21
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0003_audit_keyset_index"
+down_revision: str | None = "bf4d55615c21"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_events_created_at_id",
+        "audit_events",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_events_created_at_id", table_name="audit_events")
@@ -0,0 +1,48 @@
+"""Add (filter, created_at DESC) composite indexes on audit_events.
+
+Replaces the single-column event_type / actor_id indexes, whose leading
+column is covered by the new composites.
+
+Revision ID: 0004_audit_filter_sort_indexes
+Revises: 0003_audit_keyset_index
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0004_audit_filter_sort_indexes"
+down_revision: str | None = "0003_audit_keyset_index"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_events_evtype_created",
+        "audit_events",
+        ["event_type", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_actor_created",
+        "audit_events",
+        ["actor_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_entity_created",
+        "audit_events",
+        ["entity_id", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_audit_events_event_type", table_name="audit_events")
+    op.drop_index("ix_audit_events_actor_id", table_name="audit_events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_events_actor_id", "audit_events", ["actor_id"])
+    op.create_index("ix_audit_events_event_type", "audit_events", ["event_type"])
+    op.drop_index("ix_audit_events_entity_created", table_name="audit_events")
+    op.drop_index("ix_audit_events_actor_created", table_name="audit_events")
+    op.drop_index("ix_audit_events_evtype_created", table_name="audit_events")
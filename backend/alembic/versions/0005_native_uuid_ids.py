@@ -0,0 +1,107 @@
+"""Store primary and foreign key ids as native UUIDs instead of VARCHAR(36).
+
+On PostgreSQL every PK/FK column becomes ``uuid`` (16 bytes). Foreign keys
+must be dropped while the referenced columns change type and are recreated
+afterwards; their indexes are rebuilt by the ALTER itself.
+
+On other dialects the ORM ``GUID`` type stores 32-char hex, so existing
+hyphenated ids are rewritten in place.
+
+The free-form audit_events reference columns (actor_id, entity_id,
+correlation_id) are left as text: they are inputs to the hash chain.
+
+Revision ID: 0005_native_uuid_ids
+Revises: 0004_audit_filter_sort_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0005_native_uuid_ids"
+down_revision: str | None = "0004_audit_filter_sort_indexes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_PK_TABLES = (
+    "roles",
+    "users",
+    "documents",
+    "sections",
+    "rulesets",
+    "rule_conflicts",
+    "rewrite_jobs",
+    "section_rewrites",
+    "risk_findings",
+    "reviews",
+    "review_comments",
+    "audit_events",
+)
+
+# (table, column, referenced table, ondelete)
+_FOREIGN_KEYS = (
+    ("users", "role_id", "roles", "RESTRICT"),
+    ("documents", "created_by", "users", "RESTRICT"),
+    ("sections", "document_id", "documents", "CASCADE"),
+    ("sections", "parent_id", "sections", "SET NULL"),
+    ("rulesets", "created_by", "users", "RESTRICT"),
+    ("rule_conflicts", "ruleset_id", "rulesets", "CASCADE"),
+    ("rewrite_jobs", "document_id", "documents", "RESTRICT"),
+    ("rewrite_jobs", "ruleset_id", "rulesets", "RESTRICT"),
+    ("rewrite_jobs", "created_by", "users", "RESTRICT"),
+    ("section_rewrites", "job_id", "rewrite_jobs", "CASCADE"),
+    ("section_rewrites", "section_id", "sections", "RESTRICT"),
+    ("reviews", "rewrite_id", "section_rewrites", "RESTRICT"),
+    ("reviews", "reviewer_id", "users", "RESTRICT"),
+    ("risk_findings", "rewrite_id", "section_rewrites", "CASCADE"),
+    ("review_comments", "review_id", "reviews", "CASCADE"),
+    ("review_comments", "parent_comment_id", "review_comments", "SET NULL"),
+    ("review_comments", "author_id", "users", "RESTRICT"),
+)
+
+
+def _columns() -> list[tuple[str, str]]:
+    return [(t, "id") for t in _PK_TABLES] + [(t, c) for t, c, _, _ in _FOREIGN_KEYS]
+
+
+def _convert_postgres(to_type: str, using: str) -> None:
+    for table, column, _, _ in _FOREIGN_KEYS:
+        op.drop_constraint(f"{table}_{column}_fkey", table, type_="foreignkey")
+    for table, column in _columns():
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {to_type} USING {using.format(c=column)}"
+        )
+    for table, column, ref_table, ondelete in _FOREIGN_KEYS:
+        op.create_foreign_key(
+            f"{table}_{column}_fkey", table, ref_table, [column], ["id"], ondelete=ondelete
+        )
+
+
+def _rewrite_text(expr: str) -> None:
+    # Defer FK checks until commit so PK and FK values can change independently
+    op.execute("PRAGMA defer_foreign_keys = ON")
+    for table, column in _columns():
+        op.execute(
+            f"UPDATE {table} SET {column} = {expr.format(c=column)} WHERE {column} IS NOT NULL"
+        )
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _convert_postgres("uuid", "{c}::uuid")
+    elif dialect == "sqlite":
+        _rewrite_text("replace({c}, '-', '')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _convert_postgres("varchar(36)", "{c}::text")
+    elif dialect == "sqlite":
+        _rewrite_text(
+            "substr({c}, 1, 8) || '-' || substr({c}, 9, 4) || '-' || substr({c}, 13, 4)"
+            " || '-' || substr({c}, 17, 4) || '-' || substr({c}, 21)"
+        )
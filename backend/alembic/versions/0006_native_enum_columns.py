@@ -0,0 +1,104 @@
+"""Convert status/severity/section_type columns to native enums.
+
+0001 created these as VARCHAR although the models declare ``sa.Enum``.
+On PostgreSQL they become native enum types (4 bytes per value); other
+dialects keep VARCHAR. Labels are the StrEnum member names, which is what
+SQLAlchemy persists for ``Enum(StrEnumClass)``.
+
+Also adds a partial index over active (pending/running) rewrite jobs.
+
+Revision ID: 0006_native_enum_columns
+Revises: 0005_native_uuid_ids
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0006_native_enum_columns"
+down_revision: str | None = "0005_native_uuid_ids"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# (table, column, enum type name, labels, original varchar length)
+_ENUM_COLUMNS = (
+    (
+        "documents",
+        "status",
+        "document_status",
+        ("PENDING", "EXTRACTING", "EXTRACTED", "MAPPING", "MAPPED", "FAILED"),
+        50,
+    ),
+    (
+        "sections",
+        "section_type",
+        "section_type",
+        ("PREAMBLE", "HEADING", "CLAUSE", "DEFINITION", "TABLE", "LIST", "APPENDIX", "UNKNOWN"),
+        50,
+    ),
+    (
+        "rewrite_jobs",
+        "status",
+        "job_status",
+        ("PENDING", "RUNNING", "PAUSED", "COMPLETED", "FAILED", "CANCELLED"),
+        50,
+    ),
+    (
+        "section_rewrites",
+        "status",
+        "rewrite_status",
+        ("PENDING", "RUNNING", "COMPLETED", "FAILED", "SKIPPED"),
+        50,
+    ),
+    (
+        "risk_findings",
+        "severity",
+        "risk_severity",
+        ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"),
+        20,
+    ),
+    (
+        "reviews",
+        "status",
+        "review_status",
+        ("PENDING", "APPROVED", "REJECTED", "EDITED", "RERUN_REQUESTED"),
+        50,
+    ),
+)
+
+_ACTIVE_JOBS_WHERE = sa.text("status IN ('PENDING', 'RUNNING')")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table, column, type_name, labels, _ in _ENUM_COLUMNS:
+            sa.Enum(*labels, name=type_name).create(bind, checkfirst=True)
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE {type_name} USING {column}::{type_name}"
+            )
+
+    op.create_index(
+        "ix_rewrite_jobs_active",
+        "rewrite_jobs",
+        ["created_at"],
+        postgresql_where=_ACTIVE_JOBS_WHERE,
+        sqlite_where=_ACTIVE_JOBS_WHERE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rewrite_jobs_active", table_name="rewrite_jobs")
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table, column, type_name, labels, length in _ENUM_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE varchar({length}) USING {column}::text"
+            )
+            sa.Enum(*labels, name=type_name).drop(bind, checkfirst=True)
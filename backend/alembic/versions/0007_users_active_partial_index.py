@@ -0,0 +1,35 @@
+"""Replace users.deleted_at index with a partial index over live users.
+
+Revision ID: 0007_users_active_partial_index
+Revises: 0006_native_enum_columns
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0007_users_active_partial_index"
+down_revision: str | None = "0006_native_enum_columns"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_LIVE_USERS_WHERE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_active",
+        "users",
+        ["username"],
+        postgresql_where=_LIVE_USERS_WHERE,
+        sqlite_where=_LIVE_USERS_WHERE,
+    )
+    op.drop_index("ix_users_deleted_at", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index("ix_users_deleted_at", "users", ["deleted_at"])
+    op.drop_index("ix_users_active", table_name="users")
@@ -0,0 +1,65 @@
+"""Re-hash stored documents with BLAKE2b for upload deduplication.
+
+Uploads are now keyed by a 256-bit BLAKE2b digest (same 64-char hex width
+as the SHA-256 it replaces). Existing rows are re-hashed from the files in
+UPLOAD_DIR so duplicates of old uploads are still detected; rows whose file
+is missing keep their old value.
+
+Revision ID: 0008_blake2b_file_hashes
+Revises: 0007_users_active_partial_index
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from app.config.settings import get_settings
+
+revision: str = "0008_blake2b_file_hashes"
+down_revision: str | None = "0007_users_active_partial_index"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_CHUNK = 1 << 20
+
+_documents = sa.table(
+    "documents",
+    sa.column("id", sa.String),
+    sa.column("filename", sa.String),
+    sa.column("file_hash", sa.String),
+)
+
+
+def _rehash(algorithm: str) -> None:
+    if context.is_offline_mode():
+        # Needs the uploaded files; nothing meaningful to render as SQL
+        return
+
+    upload_dir = get_settings().upload_dir
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(_documents.c.id, _documents.c.filename)).all()
+    for doc_id, filename in rows:
+        path = upload_dir / filename
+        if not path.is_file():
+            continue
+        h = hashlib.blake2b(digest_size=32) if algorithm == "blake2b" else hashlib.sha256()
+        with path.open("rb") as fh:
+            while chunk := fh.read(_CHUNK):
+                h.update(chunk)
+        bind.execute(
+            sa.update(_documents)
+            .where(_documents.c.id == doc_id)
+            .values(file_hash=h.hexdigest())
+        )
+
+
+def upgrade() -> None:
+    _rehash("blake2b")
+
+
+def downgrade() -> None:
+    _rehash("sha256")
@@ -0,0 +1,62 @@
+"""Index the filter and sort columns used by the document and job lists.
+
+Document queries always filter on ``deleted_at IS NULL``, so the plain
+file_hash / status / deleted_at indexes are replaced by partial indexes over
+live rows. The rewrite_jobs document_id index is widened to
+(document_id, status, created_at); the old one is a prefix of it.
+
+Revision ID: 0009_list_filter_indexes
+Revises: 0008_blake2b_file_hashes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0009_list_filter_indexes"
+down_revision: str | None = "0008_blake2b_file_hashes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_LIVE_DOCUMENTS_WHERE = sa.text("deleted_at IS NULL")
+
+_DOCUMENT_INDEXES = {
+    "ix_documents_live_created_at": ["created_at"],
+    "ix_documents_live_status_created_at": ["status", "created_at"],
+    "ix_documents_live_file_hash": ["file_hash"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in _DOCUMENT_INDEXES.items():
+        op.create_index(
+            name,
+            "documents",
+            columns,
+            postgresql_where=_LIVE_DOCUMENTS_WHERE,
+            sqlite_where=_LIVE_DOCUMENTS_WHERE,
+        )
+    op.drop_index("ix_documents_file_hash", table_name="documents")
+    op.drop_index("ix_documents_status", table_name="documents")
+    op.drop_index("ix_documents_deleted_at", table_name="documents")
+
+    op.create_index(
+        "ix_rewrite_jobs_document_status_created_at",
+        "rewrite_jobs",
+        ["document_id", "status", "created_at"],
+    )
+    op.drop_index("ix_rewrite_jobs_document_id", table_name="rewrite_jobs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_rewrite_jobs_document_id", "rewrite_jobs", ["document_id"])
+    op.drop_index("ix_rewrite_jobs_document_status_created_at", table_name="rewrite_jobs")
+
+    op.create_index("ix_documents_deleted_at", "documents", ["deleted_at"])
+    op.create_index("ix_documents_status", "documents", ["status"])
+    op.create_index("ix_documents_file_hash", "documents", ["file_hash"])
+    for name in _DOCUMENT_INDEXES:
+        op.drop_index(name, table_name="documents")
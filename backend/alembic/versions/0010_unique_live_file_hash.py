@@ -0,0 +1,77 @@
+"""Make the live-document file_hash index unique.
+
+Uploads now deduplicate with INSERT ... ON CONFLICT DO NOTHING, which needs
+a unique index as its conflict target. Duplicates that slipped past the old
+check-then-insert race cannot be resolved automatically (either copy may
+already carry rewrite jobs), so the upgrade stops and lists them; soft-delete
+or merge the extra documents and run it again.
+
+Revision ID: 0010_unique_live_file_hash
+Revises: 0009_list_filter_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0010_unique_live_file_hash"
+down_revision: str | None = "0009_list_filter_indexes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_LIVE_DOCUMENTS_WHERE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT file_hash, id FROM documents
+            WHERE deleted_at IS NULL
+              AND file_hash IN (
+                SELECT file_hash FROM documents
+                WHERE deleted_at IS NULL
+                GROUP BY file_hash
+                HAVING COUNT(*) > 1
+              )
+            ORDER BY file_hash, created_at, id
+            """
+        )
+    ).all()
+    if duplicates:
+        ids_by_hash: dict[str, list[str]] = {}
+        for file_hash, doc_id in duplicates:
+            ids_by_hash.setdefault(file_hash, []).append(str(doc_id))
+        conflicts = "\n".join(
+            f"  file_hash {file_hash}: documents {', '.join(ids)}"
+            for file_hash, ids in ids_by_hash.items()
+        )
+        raise RuntimeError(
+            "Cannot add the unique live file_hash index: these live documents share "
+            "a file hash. Soft-delete or merge the extras, then re-run the upgrade.\n"
+            + conflicts
+        )
+
+    op.drop_index("ix_documents_live_file_hash", table_name="documents")
+    op.create_index(
+        "ix_documents_live_file_hash",
+        "documents",
+        ["file_hash"],
+        unique=True,
+        postgresql_where=_LIVE_DOCUMENTS_WHERE,
+        sqlite_where=_LIVE_DOCUMENTS_WHERE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_live_file_hash", table_name="documents")
+    op.create_index(
+        "ix_documents_live_file_hash",
+        "documents",
+        ["file_hash"],
+        postgresql_where=_LIVE_DOCUMENTS_WHERE,
+        sqlite_where=_LIVE_DOCUMENTS_WHERE,
+    )
@@ -0,0 +1,54 @@
+"""Store audit_events.actor_id and entity_id as native UUIDs.
+
+Both only ever hold user/entity primary keys, so they move to the same
+``GUID`` type as the ids they reference. The audit logger canonicalises
+them before hashing, and existing values are already canonical uuid4
+strings, so the hash chain verifies unchanged. correlation_id stays text:
+it is copied from a client-supplied header.
+
+Revision ID: 0011_audit_uuid_refs
+Revises: 0010_unique_live_file_hash
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0011_audit_uuid_refs"
+down_revision: str | None = "0010_unique_live_file_hash"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_COLUMNS = ("actor_id", "entity_id")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for column in _COLUMNS:
+        if dialect == "postgresql":
+            op.execute(
+                f"ALTER TABLE audit_events ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+            )
+        elif dialect == "sqlite":
+            op.execute(
+                f"UPDATE audit_events SET {column} = replace({column}, '-', '') "
+                f"WHERE {column} IS NOT NULL"
+            )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for column in _COLUMNS:
+        if dialect == "postgresql":
+            op.execute(
+                f"ALTER TABLE audit_events ALTER COLUMN {column} "
+                f"TYPE varchar(36) USING {column}::text"
+            )
+        elif dialect == "sqlite":
+            op.execute(
+                f"UPDATE audit_events SET {column} = substr({column}, 1, 8) || '-' || "
+                f"substr({column}, 9, 4) || '-' || substr({column}, 13, 4) || '-' || "
+                f"substr({column}, 17, 4) || '-' || substr({column}, 21) "
+                f"WHERE {column} IS NOT NULL"
+            )
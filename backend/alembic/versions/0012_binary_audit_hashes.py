@@ -0,0 +1,70 @@
+"""Store audit_events.event_hash and prev_hash as raw 32-byte digests.
+
+The ORM ``HexDigest`` type still hands the hashes to Python as hex, so the
+chain's hash input is unchanged and existing events verify as before.
+
+On PostgreSQL the columns become ``bytea``; the unique constraint on
+event_hash is rebuilt by the ALTER itself. SQLite does not enforce column
+types, so the stored hex text is rewritten as blobs in place.
+
+Revision ID: 0012_binary_audit_hashes
+Revises: 0011_audit_uuid_refs
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+revision: str = "0012_binary_audit_hashes"
+down_revision: str | None = "0011_audit_uuid_refs"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_COLUMNS = ("event_hash", "prev_hash")
+
+
+def _rewrite_sqlite(convert: str) -> None:
+    if context.is_offline_mode():
+        return
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, event_hash, prev_hash FROM audit_events")).all()
+    for row in rows:
+        values = {
+            column: None if value is None
+            else (bytes.fromhex(value) if convert == "binary" else value.hex())
+            for column, value in zip(_COLUMNS, row[1:], strict=True)
+        }
+        bind.execute(
+            sa.text(
+                "UPDATE audit_events SET event_hash = :event_hash, prev_hash = :prev_hash "
+                "WHERE id = :id"
+            ),
+            {"id": row.id, **values},
+        )
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for column in _COLUMNS:
+            op.execute(
+                f"ALTER TABLE audit_events ALTER COLUMN {column} TYPE bytea "
+                f"USING decode({column}, 'hex')"
+            )
+    elif dialect == "sqlite":
+        _rewrite_sqlite("binary")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for column in _COLUMNS:
+            op.execute(
+                f"ALTER TABLE audit_events ALTER COLUMN {column} TYPE varchar(64) "
+                f"USING encode({column}, 'hex')"
+            )
+    elif dialect == "sqlite":
+        _rewrite_sqlite("hex")
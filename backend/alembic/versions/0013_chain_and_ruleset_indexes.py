@@ -0,0 +1,40 @@
+"""Cover the audit chain-head lookup and index live rulesets.
+
+Every audit write reads the newest event's hash to chain onto;
+ix_audit_chain on (created_at, event_hash) answers that from the index
+alone. Ruleset queries always filter on ``deleted_at IS NULL``, so the list
+order is indexed over live rows only, as for documents.
+
+Revision ID: 0013_chain_and_ruleset_indexes
+Revises: 0012_binary_audit_hashes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0013_chain_and_ruleset_indexes"
+down_revision: str | None = "0012_binary_audit_hashes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_LIVE_RULESETS_WHERE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_chain", "audit_events", ["created_at", "event_hash"])
+    op.create_index(
+        "ix_rulesets_live_created_at",
+        "rulesets",
+        ["created_at"],
+        postgresql_where=_LIVE_RULESETS_WHERE,
+        sqlite_where=_LIVE_RULESETS_WHERE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rulesets_live_created_at", table_name="rulesets")
+    op.drop_index("ix_audit_chain", table_name="audit_events")
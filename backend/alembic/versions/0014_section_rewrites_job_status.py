@@ -0,0 +1,32 @@
+"""Index section_rewrites by (job_id, status).
+
+The orchestrator, progress counts and the job debug breakdown all filter
+rewrites by job and status. The composite index replaces the job_id index,
+which is a prefix of it. rewrite_jobs already has
+(document_id, status, created_at) from 0009.
+
+Revision ID: 0014_section_rewrites_job_status
+Revises: 0013_chain_and_ruleset_indexes
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0014_section_rewrites_job_status"
+down_revision: str | None = "0013_chain_and_ruleset_indexes"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_section_rewrites_job_status", "section_rewrites", ["job_id", "status"]
+    )
+    op.drop_index("ix_section_rewrites_job_id", table_name="section_rewrites")
+
+
+def downgrade() -> None:
+    op.create_index("ix_section_rewrites_job_id", "section_rewrites", ["job_id"])
+    op.drop_index("ix_section_rewrites_job_status", table_name="section_rewrites")
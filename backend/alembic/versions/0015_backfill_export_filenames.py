@@ -0,0 +1,57 @@
+"""Backfill rewrite_jobs.export_filename for older exports.
+
+Jobs assembled before the assembler recorded its output file have an
+export in EXPORT_DIR but no filename; the download endpoint used to find it
+by globbing and store it on first request, a write on a GET. Each such job
+now records its newest ``<job_id>_*.docx`` here, so the endpoint only
+reads. Jobs with no file on disk are left NULL.
+
+Revision ID: 0015_backfill_export_filenames
+Revises: 0014_section_rewrites_job_status
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from app.config.settings import get_settings
+
+revision: str = "0015_backfill_export_filenames"
+down_revision: str | None = "0014_section_rewrites_job_status"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_rewrite_jobs = sa.table(
+    "rewrite_jobs",
+    sa.column("id", sa.Uuid(as_uuid=False)),
+    sa.column("export_filename", sa.String),
+)
+
+
+def upgrade() -> None:
+    if context.is_offline_mode():
+        # Needs the export files; nothing meaningful to render as SQL
+        return
+
+    export_dir = get_settings().export_dir
+    bind = op.get_bind()
+    job_ids = bind.scalars(
+        sa.select(_rewrite_jobs.c.id).where(_rewrite_jobs.c.export_filename.is_(None))
+    ).all()
+    for job_id in job_ids:
+        candidates = list(export_dir.glob(f"{job_id}_*.docx"))
+        if not candidates:
+            continue
+        newest = max(candidates, key=lambda p: p.stat().st_mtime)
+        bind.execute(
+            sa.update(_rewrite_jobs)
+            .where(_rewrite_jobs.c.id == job_id)
+            .values(export_filename=newest.name)
+        )
+
+
+def downgrade() -> None:
+    # The backfilled names are correct under the old schema too
+    pass
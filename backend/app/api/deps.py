@@ -6,16 +6,19 @@ All authentication and authorization logic lives here, not in routes.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Annotated
 
 import structlog
 from fastapi import Depends, Header, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
+from jwt import InvalidTokenError
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.logging_config import current_log_user
+from app.core.cache import TTLCache
 from app.core.errors import AuthError, ErrorCode, ForbiddenError
 from app.core.security import decode_token, safe_str_compare
 from app.db.models.user import RoleEnum, User
@@ -23,17 +26,81 @@ from app.db.session import get_db
 
 _log = structlog.get_logger(__name__)
 _bearer = HTTPBearer(auto_error=False)
+_CSRF_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedRole:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """
+    Read-only snapshot of the authenticated user.
+
+    Detached from any session so it can be cached and shared across requests.
+    Routes that need to modify the user must load the ORM row themselves.
+    """
+
+    id: str
+    username: str
+    email: str | None
+    is_active: bool
+    role: AuthenticatedRole
+
+
+# Keyed by user id; the token itself is still verified on every request
+_user_cache: TTLCache[str, AuthenticatedUser] = TTLCache(maxsize=10_000, ttl=30)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user's cached snapshot, e.g. after deactivation."""
+    _user_cache.pop(user_id)
+
+
+async def get_user_snapshot(db: AsyncSession, user_id: str) -> AuthenticatedUser | None:
+    """
+    Return the cached snapshot of a user, loading it on a miss.
+
+    Returns None for unknown or soft-deleted users. Callers must still check
+    ``is_active``.
+    """
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    row = (
+        await db.execute(
+            select(User)
+            .options(selectinload(User.role))
+            .where(User.id == user_id)
+        )
+    ).scalar_one_or_none()
+    if row is None or row.is_deleted:
+        return None
+
+    user = AuthenticatedUser(
+        id=row.id,
+        username=row.username,
+        email=row.email,
+        is_active=row.is_active,
+        role=AuthenticatedRole(name=row.role.name),
+    )
+    _user_cache.set(user_id, user)
+    return user
 
 
 async def get_current_user(
     request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_bearer)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> AuthenticatedUser:
     """
-    Validate JWT Bearer token and return the authenticated User.
+    Validate JWT Bearer token and return the authenticated user.
 
-    Raises AuthError on any JWT problem.
+    The user row is cached for a few seconds, so most requests skip the
+    lookup entirely. Raises AuthError on any JWT problem.
     """
     if credentials is None:
         raise AuthError(
@@ -42,7 +109,7 @@ async def get_current_user(
 
     try:
         payload = decode_token(credentials.credentials)
-    except JWTError as exc:
+    except InvalidTokenError as exc:
         raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "Token invalid or expired") from exc
 
     if payload.get("type") != "access":
@@ -52,34 +119,29 @@ async def get_current_user(
     if not user_id:
         raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "Token missing subject")
 
-    user_result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id)
-    )
-    user = user_result.scalar_one_or_none()
-    if user is None or user.is_deleted:
+    user = await get_user_snapshot(db, user_id)
+    if user is None:
         raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "User not found")
-
     if not user.is_active:
         raise AuthError(ErrorCode.AUTH_USER_INACTIVE, "Account is deactivated")
 
-    structlog.contextvars.bind_contextvars(
-        user_id=user.id, username=user.username
-    )
+    current_log_user.set((user.id, user.username))
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
 
 
 def require_roles(*roles: RoleEnum):
     """Return a dependency callable that enforces role membership."""
+    # Resolved once per dependency, not per request
+    allowed_list = [r.value for r in roles]
+    allowed = frozenset(allowed_list)
 
-    async def _check(user: CurrentUser) -> User:
-        if user.role.name not in [r.value for r in roles]:
+    async def _check(user: CurrentUser) -> AuthenticatedUser:
+        if user.role.name not in allowed:
             raise ForbiddenError(
-                f"This action requires one of: {[r.value for r in roles]}. "
+                f"This action requires one of: {allowed_list}. "
                 f"Your role is: {user.role.name}"
             )
         return user
@@ -101,18 +163,15 @@ async def get_csrf_token(
 
     GET / HEAD / OPTIONS are exempt.
     """
-    if request.method in ("GET", "HEAD", "OPTIONS"):
+    if request.method in _CSRF_SAFE_METHODS:
         return
 
     cookie_token = request.cookies.get("fillwise_csrf")
     if not cookie_token:
-        from app.core.errors import AuthError, ErrorCode
         raise AuthError(ErrorCode.AUTH_CSRF_INVALID, "CSRF cookie missing")
 
     if not x_csrf_token:
-        from app.core.errors import AuthError, ErrorCode
         raise AuthError(ErrorCode.AUTH_CSRF_INVALID, "X-CSRF-Token header missing")
 
     if not safe_str_compare(cookie_token, x_csrf_token):
-        from app.core.errors import AuthError, ErrorCode
         raise AuthError(ErrorCode.AUTH_CSRF_INVALID, "CSRF token mismatch")
@@ -4,16 +4,18 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import AdminUser, CurrentUser, get_db
+from app.api.deps import AdminUser, CurrentUser, get_db, invalidate_cached_user
 from app.core.errors import ConflictError, ErrorCode, NotFoundError, ValidationError
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.db.models.user import Role, User
 from app.schemas.auth import CreateUserRequest, UserOut
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -25,23 +27,20 @@ router = APIRouter(prefix="/admin", tags=["admin"])
     dependencies=[AdminUser],
 )
 async def list_users(db: Annotated[AsyncSession, Depends(get_db)]) -> list[UserOut]:
+    # Select only the output columns: no ORM hydration, no password hashes
     result = await db.execute(
-        select(User).where(User.deleted_at.is_(None)).order_by(User.created_at)
-    )
-    users = result.scalars().all()
-    out = []
-    for u in users:
-        await db.refresh(u, ["role"])
-        out.append(
-            UserOut(
-                id=u.id,
-                username=u.username,
-                email=u.email,
-                role=u.role.name,
-                is_active=u.is_active,
-            )
+        select(
+            User.id,
+            User.username,
+            User.email,
+            Role.name.label("role"),
+            User.is_active,
         )
-    return out
+        .join(User.role)
+        .where(User.deleted_at.is_(None))
+        .order_by(User.created_at)
+    )
+    return [UserOut.model_construct(**row) for row in result.mappings()]
 
 
 @router.post(
@@ -52,54 +51,64 @@ async def list_users(db: Annotated[AsyncSession, Depends(get_db)]) -> list[UserO
     dependencies=[AdminUser],
 )
 async def create_user(
+    request: Request,
     body: CreateUserRequest,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserOut:
-    # Check username taken
-    existing = await db.execute(
-        select(User).where(User.username == body.username, User.deleted_at.is_(None))
-    )
-    if existing.scalar_one_or_none():
-        raise ConflictError(ErrorCode.VALIDATION_ERROR, f"Username '{body.username}' is taken.")
-
-    # Resolve role
-    role_result = await db.execute(select(Role).where(Role.name == body.role))
-    role = role_result.scalar_one_or_none()
-    if role is None:
+    # Resolve role from the map loaded at startup; fall back to the database
+    # when the app was started without its lifespan (e.g. in tests)
+    role_ids: dict[str, str] | None = getattr(request.app.state, "role_ids", None)
+    if role_ids is not None:
+        role_id = role_ids.get(body.role)
+    else:
+        role_id = (
+            await db.execute(select(Role.id).where(Role.name == body.role))
+        ).scalar_one_or_none()
+    if role_id is None:
         raise ValidationError(
             f"Role '{body.role}' does not exist.",
             detail={"valid_roles": ["admin", "editor", "reviewer", "viewer"]},
         )
 
-    user = User(
-        username=body.username,
-        email=body.email,
-        password_hash=hash_password(body.password),
-        role_id=role.id,
-        is_active=True,
+    # Uniqueness check and insert in one race-free statement; an empty
+    # RETURNING means the username is already taken
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    password_hash = await hash_password_async(body.password)
+    result = await db.execute(
+        insert(User)
+        .values(
+            username=body.username,
+            email=body.email,
+            password_hash=password_hash,
+            role_id=role_id,
+            is_active=True,
+        )
+        .on_conflict_do_nothing(index_elements=[User.username])
+        .returning(User.id)
     )
-    db.add(user)
-    await db.flush()
+    user_id = result.scalar_one_or_none()
+    if user_id is None:
+        raise ConflictError(ErrorCode.VALIDATION_ERROR, f"Username '{body.username}' is taken.")
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="user.created",
         actor_id=current_user.id,
         actor_username=current_user.username,
         entity_type="User",
-        entity_id=user.id,
-        payload={"username": user.username, "role": body.role},
+        entity_id=user_id,
+        payload={"username": body.username, "role": body.role},
+        durable=True,
     )
     await db.commit()
-    await db.refresh(user, ["role"])
 
-    return UserOut(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        role=user.role.name,
-        is_active=user.is_active,
+    return UserOut.model_construct(
+        id=user_id,
+        username=body.username,
+        email=body.email,
+        role=body.role,
+        is_active=True,
     )
 
 
@@ -122,12 +131,15 @@ async def deactivate_user(
 
     user.soft_delete()
     user.is_active = False
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="user.deactivated",
         actor_id=current_user.id,
         actor_username=current_user.username,
         entity_type="User",
         entity_id=user.id,
+        durable=True,
     )
     await db.commit()
+    # Only after commit, so a concurrent request cannot re-cache the still-active row
+    invalidate_cached_user(user.id)
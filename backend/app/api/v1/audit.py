@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import uuid
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import AdminUser, get_db
+from app.core.errors import ValidationError
 from app.db.models.audit import AuditEvent
+from app.db.session import window_total
 from app.schemas.audit import AuditEventOut, AuditListResponse, ChainVerificationResult
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import verify_chain as verify_audit_chain
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
 
+def _encode_cursor(event: AuditEvent) -> str:
+    """Encode the (created_at, id) seek key of an event as an opaque cursor."""
+    raw = f"{event.created_at.isoformat()}|{event.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor; raises ValidationError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts, event_id = raw.split("|", 1)
+        return datetime.fromisoformat(ts), str(uuid.UUID(event_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError("Invalid pagination cursor", detail={"cursor": cursor}) from exc
+
+
 @router.get(
     "",
     response_model=AuditListResponse,
@@ -26,30 +48,72 @@ async def list_audit_events(
     db: Annotated[AsyncSession, Depends(get_db)],
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque next_cursor from a previous page; takes precedence over page",
+    ),
     event_type: str | None = Query(default=None),
     entity_id: str | None = Query(default=None),
     actor_id: str | None = Query(default=None),
 ) -> AuditListResponse:
-    """Return paginated audit events with optional filters."""
-    query = select(AuditEvent)
+    """
+    Return paginated audit events with optional filters.
+
+    Prefer ``cursor`` over ``page`` for deep pagination: the cursor seeks
+    directly to the next (created_at, id) key via the composite index
+    instead of scanning and discarding ``(page - 1) * page_size`` rows.
+    """
+    filters = []
     if event_type:
-        query = query.where(AuditEvent.event_type == event_type)
+        filters.append(AuditEvent.event_type == event_type)
     if entity_id:
-        query = query.where(AuditEvent.entity_id == entity_id)
+        filters.append(AuditEvent.entity_id == entity_id)
     if actor_id:
-        query = query.where(AuditEvent.actor_id == actor_id)
+        filters.append(AuditEvent.actor_id == actor_id)
 
-    count = await db.execute(select(func.count()).select_from(query.subquery()))
-    result = await db.execute(
-        query.order_by(AuditEvent.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    query = (
+        select(AuditEvent)
+        .where(*filters)
+        .order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
     )
+    total: int | None = None
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        # tuple_() does not type its right-hand values; bind them with the
+        # column types so the id compares as a uuid (native on PostgreSQL)
+        query = query.where(
+            tuple_(AuditEvent.created_at, AuditEvent.id)
+            < tuple_(
+                literal(cursor_ts, AuditEvent.created_at.type),
+                literal(cursor_id, AuditEvent.id.type),
+            )
+        )
+        # No total here: counting would read every row past the cursor,
+        # defeating the seek. Fetch one extra row to learn whether a next
+        # page exists.
+        events = list((await db.scalars(query.limit(page_size + 1))).all())
+    else:
+        # The total is computed inline with the page by a window function, so
+        # the endpoint needs a single query instead of a page query plus a COUNT
+        result = await db.execute(
+            query.add_columns(func.count().over().label("total"))
+            .offset((page - 1) * page_size)
+            .limit(page_size + 1)
+        )
+        rows = result.all()
+        total = await window_total(
+            db, rows, page, select(func.count()).select_from(AuditEvent).where(*filters)
+        )
+        events = [row.AuditEvent for row in rows]
+
+    has_more = len(events) > page_size
+    events = events[:page_size]
     return AuditListResponse(
-        items=[AuditEventOut.model_validate(e) for e in result.scalars().all()],
-        total=count.scalar_one(),
+        items=[AuditEventOut.model_validate(e) for e in events],
+        total=total,
         page=page,
         page_size=page_size,
+        next_cursor=_encode_cursor(events[-1]) if has_more else None,
     )
 
 
@@ -69,7 +133,7 @@ async def verify_chain(db: Annotated[AsyncSession, Depends(get_db)]) -> ChainVer
     count_result = await db.execute(select(func.count()).select_from(AuditEvent))
     total = count_result.scalar_one()
 
-    is_valid, broken_at = await AuditLogger.verify_chain(db)
+    is_valid, broken_at = await verify_audit_chain(db)
 
     return ChainVerificationResult(
         is_valid=is_valid,
@@ -8,8 +8,9 @@ import structlog
 from fastapi import APIRouter, Depends, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.api.deps import CurrentUser, get_db
+from app.api.deps import CurrentUser, get_db, get_user_snapshot
 from app.config.settings import get_settings
 from app.core.errors import AuthError, ErrorCode
 from app.core.security import (
@@ -17,9 +18,10 @@ from app.core.security import (
     create_refresh_token,
     create_ws_ticket,
     decode_token,
+    dummy_password_hash,
     generate_csrf_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from app.db.models.user import User
 from app.schemas.auth import (
@@ -29,7 +31,7 @@ from app.schemas.auth import (
     TokenResponse,
     UserOut,
 )
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 
 _log = structlog.get_logger(__name__)
 
@@ -48,18 +50,22 @@ async def login(
     Returns access + refresh tokens and sets a CSRF cookie.
     """
     result = await db.execute(
-        select(User).where(User.username == body.username, User.deleted_at.is_(None))
+        select(User)
+        .options(joinedload(User.role))
+        .where(User.username == body.username, User.deleted_at.is_(None))
     )
     user: User | None = result.scalar_one_or_none()
 
-    if user is None or not verify_password(body.password, user.password_hash):
+    # Run bcrypt even for unknown usernames so timing doesn't leak account existence
+    password_hash = user.password_hash if user is not None else dummy_password_hash()
+    password_ok = await verify_password_async(body.password, password_hash)
+    if user is None or not password_ok:
         _log.warning("login_failed", username=body.username)
         raise AuthError(ErrorCode.AUTH_INVALID_CREDENTIALS, "Invalid username or password")
 
     if not user.is_active:
         raise AuthError(ErrorCode.AUTH_USER_INACTIVE, "Account is deactivated")
 
-    await db.refresh(user, ["role"])
     access = create_access_token(subject=user.id, role=user.role.name)
     refresh = create_refresh_token(subject=user.id)
 
@@ -70,12 +76,12 @@ async def login(
         value=csrf_token,
         httponly=False,   # Must be readable by JS to set header
         samesite="strict",
-        secure=settings.environment.value == "production",
-        max_age=settings.csrf_token_expire_minutes * 60,
+        secure=settings.is_production,
+        max_age=settings.csrf_token_expire_seconds,
     )
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="auth.login",
         actor_id=user.id,
         actor_username=user.username,
@@ -85,11 +91,12 @@ async def login(
     await db.commit()
 
     _log.info("login_success", username=user.username, role=user.role.name)
-    return TokenResponse(
+    # Server-produced values; the response model still validates on output
+    return TokenResponse.model_construct(
         access_token=access,
         refresh_token=refresh,
         token_type="bearer",
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        expires_in=settings.jwt_access_token_expire_seconds,
     )
 
 
@@ -107,24 +114,25 @@ async def refresh_token(
     if payload.get("type") != "refresh":
         raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "Not a refresh token")
 
-    user = await db.get(User, payload["sub"])
+    # Served from the same short-lived snapshot cache as get_current_user,
+    # so frequent refreshes skip the database
+    user = await get_user_snapshot(db, str(payload["sub"]))
     if user is None or not user.is_active:
         raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "User not found")
 
-    await db.refresh(user, ["role"])
     settings = get_settings()
-    return TokenResponse(
+    return TokenResponse.model_construct(
         access_token=create_access_token(subject=user.id, role=user.role.name),
         refresh_token=body.refresh_token,
         token_type="bearer",
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        expires_in=settings.jwt_access_token_expire_seconds,
     )
 
 
 @router.get("/me", response_model=UserOut, summary="Current user profile")
 async def get_me(current_user: CurrentUser) -> UserOut:
     """Return the authenticated user's profile."""
-    return UserOut(
+    return UserOut.model_construct(
         id=current_user.id,
         username=current_user.username,
         email=current_user.email,
@@ -140,17 +148,22 @@ async def change_password(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> None:
     """Change the authenticated user's password."""
-    if not verify_password(body.current_password, current_user.password_hash):
+    # CurrentUser is a cached snapshot; load the row to read and update the hash
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise AuthError(ErrorCode.AUTH_TOKEN_INVALID, "User not found")
+    if not await verify_password_async(body.current_password, user.password_hash):
         raise AuthError(ErrorCode.AUTH_INVALID_CREDENTIALS, "Current password is incorrect")
 
-    current_user.password_hash = hash_password(body.new_password)
-    audit = AuditLogger(db)
-    await audit.log(
+    user.password_hash = await hash_password_async(body.new_password)
+    await audit_log(
+        db,
         event_type="auth.password_changed",
         actor_id=current_user.id,
         actor_username=current_user.username,
         entity_type="User",
         entity_id=current_user.id,
+        durable=True,
     )
     await db.commit()
 
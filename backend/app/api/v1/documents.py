@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-import hashlib
+import os
 import uuid
 from pathlib import Path
 from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
 from fastapi.responses import FileResponse
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, EditorUser, ReviewerUser, get_db
 from app.config.settings import get_settings
 from app.core.errors import ConflictError, ErrorCode, NotFoundError, ValidationError
+from app.core.uploads import receive_file_upload
 from app.db.models.document import Document, DocumentStatus, Section
+from app.db.models.job import RewriteJob
+from app.db.session import get_session_factory, window_total
 from app.schemas.document import (
     DocumentGraphNode,
     DocumentListResponse,
@@ -24,21 +30,20 @@ from app.schemas.document import (
     DocumentUploadResponse,
     SectionOut,
 )
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 from app.services.ingestion.parser import DocumentProcessor
 
 _log = structlog.get_logger(__name__)
 router = APIRouter(prefix="/documents", tags=["documents"])
 
-
-def _sha256(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+# Whole-list validation from ORM rows in one pydantic-core call; the
+# response_model then serializes straight to JSON bytes
+_documents_out = TypeAdapter(list[DocumentOut])
+_sections_out = TypeAdapter(list[SectionOut])
 
 
 async def _run_ingestion(document_id: str) -> None:
     """Background task wrapper for document processing."""
-    from app.db.session import get_session_factory
-
     try:
         factory = get_session_factory()
         async with factory() as db:
@@ -57,15 +62,38 @@ async def _run_ingestion(document_id: str) -> None:
         )
 
 
+# The body is parsed by receive_file_upload rather than a File() parameter,
+# so the multipart schema is declared for the OpenAPI docs by hand
+_UPLOAD_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["file"],
+                "properties": {
+                    "file": {
+                        "type": "string",
+                        "format": "binary",
+                        "description": "PDF or DOCX file",
+                    }
+                },
+            }
+        }
+    },
+}
+
+
 @router.post(
     "",
     response_model=DocumentUploadResponse,
     status_code=201,
     summary="Upload a PDF or DOCX document",
     dependencies=[EditorUser],
+    openapi_extra={"requestBody": _UPLOAD_REQUEST_BODY},
 )
 async def upload_document(
-    file: Annotated[UploadFile, File(description="PDF or DOCX file")],
+    request: Request,
     background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -73,12 +101,18 @@ async def upload_document(
     """
     Upload a document for processing.
 
-    Validates MIME type and file size, stores file securely, then
-    schedules ingestion as a background task.
+    Streams the file straight to the upload directory, validates MIME type
+    and size, then schedules ingestion as a background task.
     """
     settings = get_settings()
 
+    # Write to a .part file and only move it into place once accepted
+    token = uuid.uuid4().hex
+    part = settings.upload_dir / f"{token}.part"
+    file = await receive_file_upload(request, "file", part, settings.max_upload_bytes)
+
     if file.content_type not in settings.allowed_mime_types:
+        part.unlink(missing_ok=True)
         raise ValidationError(
             f"Unsupported file type: {file.content_type}",
             detail={
@@ -87,50 +121,48 @@ async def upload_document(
             },
         )
 
-    raw = await file.read()
-    if len(raw) > settings.max_upload_size_mb * 1024 * 1024:
-        raise ValidationError(
-            f"File exceeds maximum allowed size of {settings.max_upload_size_mb}MB",
-            detail={"size_bytes": len(raw), "limit_bytes": settings.max_upload_size_mb * 1024 * 1024},  # noqa: E501
-        )
-
-    file_hash = _sha256(raw)
+    # Normalise filename to prevent path traversal
+    safe_name = f"{token}{Path(file.filename or 'upload').suffix.lower()}"
+    dest = settings.upload_dir / safe_name
 
-    # Check for duplicate
-    existing = await db.execute(
-        select(Document).where(Document.file_hash == file_hash, Document.deleted_at.is_(None))
-    )
-    if existing.scalar_one_or_none():
+    # Uniqueness check and insert in one race-free statement against the
+    # partial unique index on live file hashes; no row back means duplicate
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    doc = (
+        await db.scalars(
+            insert(Document)
+            .values(
+                filename=safe_name,
+                original_filename=file.filename or "unknown",
+                mime_type=file.content_type or "application/octet-stream",
+                file_size_bytes=file.size_bytes,
+                file_hash=file.file_hash,
+                status=DocumentStatus.PENDING,
+                created_by=current_user.id,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Document.file_hash],
+                index_where=Document.deleted_at.is_(None),
+            )
+            .returning(Document)
+        )
+    ).one_or_none()
+    if doc is None:
+        part.unlink(missing_ok=True)
         raise ConflictError(
             ErrorCode.DOC_HASH_DUPLICATE,
             "A document with an identical content hash already exists.",
         )
+    os.replace(part, dest)
 
-    # Normalise filename to prevent path traversal
-    safe_name = f"{uuid.uuid4().hex}{Path(file.filename or 'upload').suffix.lower()}"
-    dest = settings.upload_dir / safe_name
-    dest.write_bytes(raw)
-
-    doc = Document(
-        filename=safe_name,
-        original_filename=file.filename or "unknown",
-        mime_type=file.content_type or "application/octet-stream",
-        file_size_bytes=len(raw),
-        file_hash=file_hash,
-        status=DocumentStatus.PENDING,
-        created_by=current_user.id,
-    )
-    db.add(doc)
-    await db.flush()
-
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="document.uploaded",
         actor_id=current_user.id,
         actor_username=current_user.username,
         entity_type="Document",
         entity_id=doc.id,
-        payload={"filename": doc.original_filename, "size_bytes": len(raw)},
+        payload={"filename": doc.original_filename, "size_bytes": file.size_bytes},
     )
     await db.commit()
 
@@ -159,21 +191,25 @@ async def list_documents(
     status: DocumentStatus | None = Query(default=None),  # noqa: B008
 ) -> DocumentListResponse:
     """List documents with optional status filter and pagination."""
-    query = select(Document).where(Document.deleted_at.is_(None))
+    filters: list[ColumnElement[bool]] = [Document.deleted_at.is_(None)]
     if status:
-        query = query.where(Document.status == status)
-
-    count_result = await db.execute(
-        select(func.count()).select_from(query.subquery())
-    )
-    total = count_result.scalar_one()
+        filters.append(Document.status == status)
 
+    # Page and total in one round-trip via a window count
     result = await db.execute(
-        query.order_by(Document.created_at.desc())
+        select(Document, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Document.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
-    items = [DocumentOut.model_validate(d) for d in result.scalars().all()]
+    rows = result.all()
+    total = await window_total(
+        db, rows, page, select(func.count()).select_from(Document).where(*filters)
+    )
+    items = _documents_out.validate_python(
+        [row.Document for row in rows], from_attributes=True
+    )
 
     return DocumentListResponse(items=items, total=total, page=page, page_size=page_size)
 
@@ -209,8 +245,8 @@ async def delete_document(
     if doc is None or doc.is_deleted:
         raise NotFoundError("Document", document_id)
     doc.soft_delete()
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="document.deleted",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -239,7 +275,7 @@ async def list_sections(
         .where(Section.document_id == document_id)
         .order_by(Section.sequence_no)
     )
-    return [SectionOut.model_validate(s) for s in result.scalars().all()]
+    return _sections_out.validate_python(result.scalars().all(), from_attributes=True)
 
 
 @router.get(
@@ -257,25 +293,23 @@ async def get_document_graph(
     if doc is None or doc.is_deleted:
         raise NotFoundError("Document", document_id)
 
+    # Select exactly the SectionOut columns: no ORM identity-map hydration
     result = await db.execute(
-        select(Section)
+        select(*(getattr(Section, name) for name in SectionOut.model_fields))
         .where(Section.document_id == document_id)
         .order_by(Section.sequence_no)
     )
-    sections = list(result.scalars().all())
 
-    # Build tree
+    # Single pass: the parser only parents a section to an earlier heading,
+    # so in sequence order every parent is already in ``nodes``
     nodes: dict[str, DocumentGraphNode] = {}
     roots: list[DocumentGraphNode] = []
-
-    for s in sections:
-        node = DocumentGraphNode(section=SectionOut.model_validate(s))
-        nodes[s.id] = node
-
-    for s in sections:
-        node = nodes[s.id]
-        if s.parent_id and s.parent_id in nodes:
-            nodes[s.parent_id].children.append(node)
+    for row in result.mappings():
+        node = DocumentGraphNode(section=SectionOut(**row))
+        nodes[row["id"]] = node
+        parent = nodes.get(row["parent_id"]) if row["parent_id"] else None
+        if parent is not None:
+            parent.children.append(node)
         else:
             roots.append(node)
 
@@ -293,30 +327,25 @@ async def export_document(
     job_id: str = Query(..., description="Job ID whose assembled output to download"),
 ) -> FileResponse:
     """Download the assembled DOCX for an approved job."""
-    from app.db.models.job import RewriteJob
-
     settings = get_settings()
     job = await db.get(RewriteJob, job_id)
     if job is None or job.document_id != document_id:
         raise NotFoundError("RewriteJob", job_id)
 
-    # Use persisted export_filename when available; fall back to glob search
-    if job.export_filename:
-        export_path = settings.export_dir / job.export_filename
-        if export_path.exists():
-            return FileResponse(
-                path=str(export_path),
-                media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                filename=f"fillwise_export_{job_id[:8]}.docx",
-            )
-
-    candidates = list(settings.export_dir.glob(f"{job_id}_*.docx"))
-    if not candidates:
+    # The assembler records the file it wrote (older jobs were backfilled by
+    # migration 0015); one stat both checks that it is still there and is
+    # handed to FileResponse so it isn't repeated
+    if not job.export_filename:
         raise NotFoundError("Export file for job", job_id)
+    export_path = settings.export_dir / job.export_filename
+    try:
+        stat_result = export_path.stat()
+    except FileNotFoundError:
+        raise NotFoundError("Export file for job", job_id) from None
 
-    latest = max(candidates, key=lambda p: p.stat().st_mtime)
     return FileResponse(
-        path=str(latest),
+        path=str(export_path),
+        stat_result=stat_result,
         media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         filename=f"fillwise_export_{job_id[:8]}.docx",
     )
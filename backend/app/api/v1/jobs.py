@@ -6,8 +6,10 @@ from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
-from sqlalchemy import delete as sa_delete, func, select, update
+from pydantic import TypeAdapter
+from sqlalchemy import delete as sa_delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.api.deps import CurrentUser, EditorUser, ReviewerUser, get_db
 from app.config.settings import get_settings
@@ -22,6 +24,7 @@ from app.db.models.document import Document, DocumentStatus, Section
 from app.db.models.job import JobStatus, RewriteJob, RewriteStatus, SectionRewrite
 from app.db.models.review import Review, ReviewStatus
 from app.db.models.ruleset import Ruleset
+from app.db.session import bulk_insert, get_session_factory, window_total
 from app.schemas.job import (
     CreateJobRequest,
     JobListResponse,
@@ -29,30 +32,37 @@ from app.schemas.job import (
     SectionRewriteOut,
 )
 from app.services.assembly.docx_builder import AssemblyEngine
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 from app.services.llm.client import get_ollama_client
 from app.services.llm.orchestrator import request_cancellation
 
 _log = structlog.get_logger(__name__)
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Validates a page of ORM rows in one pydantic-core call
+_jobs_out = TypeAdapter(list[RewriteJobOut])
+
 
 async def _schedule_rewrites(job: RewriteJob, sections: list[Section], db: AsyncSession) -> None:
     """Create pending SectionRewrite records for each section."""
     settings = get_settings()
-    for section in sections:
-        rewrite = SectionRewrite(
-            job_id=job.id,
-            section_id=section.id,
-            status=RewriteStatus.PENDING,
-            prompt_hash="",
-            prompt_text="",
-            model_name=settings.ollama_model,
-        )
-        db.add(rewrite)
-
     job.total_sections = len(sections)
-    await db.flush()
+    # One multi-row INSERT instead of a unit-of-work flush of N ORM objects
+    await bulk_insert(
+        db,
+        SectionRewrite,
+        [
+            {
+                "job_id": job.id,
+                "section_id": section.id,
+                "status": RewriteStatus.PENDING,
+                "prompt_hash": "",
+                "prompt_text": "",
+                "model_name": settings.ollama_model,
+            }
+            for section in sections
+        ],
+    )
 
 
 @router.post(
@@ -137,8 +147,8 @@ async def create_job(
 
     await _schedule_rewrites(job, sections, db)
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="job.created",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -170,21 +180,29 @@ async def list_jobs(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
 ) -> JobListResponse:
-    query = select(RewriteJob)
+    filters = []
     if document_id:
-        query = query.where(RewriteJob.document_id == document_id)
+        filters.append(RewriteJob.document_id == document_id)
     if status:
-        query = query.where(RewriteJob.status == status)
+        filters.append(RewriteJob.status == status)
 
-    count = await db.execute(select(func.count()).select_from(query.subquery()))
+    # Page and total in one round-trip via a window count
     result = await db.execute(
-        query.order_by(RewriteJob.created_at.desc())
+        select(RewriteJob, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(RewriteJob.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
+    rows = result.all()
+    total = await window_total(
+        db, rows, page, select(func.count()).select_from(RewriteJob).where(*filters)
+    )
     return JobListResponse(
-        items=[RewriteJobOut.model_validate(j) for j in result.scalars().all()],
-        total=count.scalar_one(),
+        items=_jobs_out.validate_python(
+            [row.RewriteJob for row in rows], from_attributes=True
+        ),
+        total=total,
     )
 
 
@@ -221,12 +239,14 @@ async def list_rewrites(
     result = await db.execute(
         select(SectionRewrite)
         .where(SectionRewrite.job_id == job_id)
+        .options(
+            selectinload(SectionRewrite.risk_findings),
+            selectinload(SectionRewrite.review),
+        )
         .order_by(SectionRewrite.created_at)
     )
-    rewrites = list(result.scalars().all())
     out = []
-    for r in rewrites:
-        await db.refresh(r, ["risk_findings", "review"])
+    for r in result.scalars().all():
         model_out = SectionRewriteOut.model_validate(r)
         if r.review:
             model_out.review_status = r.review.status
@@ -263,42 +283,38 @@ async def assemble_job(
         )
 
     # ── Pre-flight: ensure every rewrite has an approved review ──────
-    rewrite_result = await db.execute(
-        select(SectionRewrite).where(SectionRewrite.job_id == job_id)
-    )
-    rewrites = list(rewrite_result.scalars().all())
-
-    rewrite_ids = [r.id for r in rewrites]
-    reviews_by_rewrite: dict[str, Review] = {}
-    if rewrite_ids:
-        review_result = await db.execute(
-            select(Review).where(Review.rewrite_id.in_(rewrite_ids))
+    # Fetch only the offending rewrites; an empty result means all approved
+    blocked = (
+        await db.execute(
+            select(SectionRewrite.id, Review.status)
+            .outerjoin(Review, Review.rewrite_id == SectionRewrite.id)
+            .where(
+                SectionRewrite.job_id == job_id,
+                or_(
+                    Review.id.is_(None),
+                    Review.status.not_in([ReviewStatus.APPROVED, ReviewStatus.EDITED]),
+                ),
+            )
         )
-        reviews_by_rewrite = {r.rewrite_id: r for r in review_result.scalars().all()}
+    ).all()
 
-    unreviewed = [r for r in rewrites if r.id not in reviews_by_rewrite]
+    unreviewed = [rid for rid, status in blocked if status is None]
     if unreviewed:
         raise ValidationError(
             f"{len(unreviewed)} page(s) have not been reviewed yet. "
             "Review all pages before assembling.",
-            detail={"unreviewed_rewrite_ids": [r.id for r in unreviewed]},
+            detail={"unreviewed_rewrite_ids": unreviewed},
         )
 
-    unapproved = [
-        r for r in rewrites
-        if r.id in reviews_by_rewrite
-        and reviews_by_rewrite[r.id].status not in (ReviewStatus.APPROVED, ReviewStatus.EDITED)
-    ]
+    unapproved = [rid for rid, _ in blocked]
     if unapproved:
         raise ValidationError(
             f"{len(unapproved)} page(s) have not been approved. "
             "Approve or edit all pages before assembling.",
-            detail={"unapproved_rewrite_ids": [r.id for r in unapproved]},
+            detail={"unapproved_rewrite_ids": unapproved},
         )
 
     async def _assemble(jid: str, username: str) -> None:
-        from app.db.session import get_session_factory
-
         factory = get_session_factory()
         async with factory() as session:
             engine = AssemblyEngine(session)
@@ -371,8 +387,8 @@ async def restart_job(
     job.completed_sections = completed_count_result.scalar_one()
 
     # Audit and job-reset are part of the same transaction
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="job.restarted",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -421,8 +437,8 @@ async def cancel_job(
     job.error_message = "Job was stopped by user."
 
     # Audit and status change in the same transaction
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="job.cancelled",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -443,27 +459,41 @@ async def cancel_job(
 async def debug_job(
     job_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
+    limit: int = Query(default=200, ge=1, le=1000),
 ) -> dict[str, object]:
     """
     Get detailed debugging information about a job and its sections.
     
-    Useful for diagnosing stuck or failed jobs.
+    Useful for diagnosing stuck or failed jobs. The status breakdown covers
+    every section; the per-section detail is capped at ``limit`` rows.
     """
     job = await db.get(RewriteJob, job_id)
     if job is None:
         raise NotFoundError("RewriteJob", job_id)
 
-    # Get all rewrites with their statuses
+    # Breakdown aggregated in the database rather than over loaded rows
+    counts = await db.execute(
+        select(SectionRewrite.status, func.count())
+        .where(SectionRewrite.job_id == job_id)
+        .group_by(SectionRewrite.status)
+    )
+    status_counts = {status.value: count for status, count in counts.all()}
+
+    # Only the columns reported below; the prompt and rewritten text stay put
     result = await db.execute(
-        select(SectionRewrite)
+        select(
+            SectionRewrite.id,
+            SectionRewrite.section_id,
+            SectionRewrite.status,
+            SectionRewrite.error_message,
+            SectionRewrite.attempt_number,
+            SectionRewrite.tokens_completion,
+            SectionRewrite.duration_ms,
+        )
         .where(SectionRewrite.job_id == job_id)
         .order_by(SectionRewrite.created_at)
+        .limit(limit)
     )
-    rewrites = list(result.scalars().all())
-
-    status_counts = {}
-    for rewrite in rewrites:
-        status_counts[rewrite.status.value] = status_counts.get(rewrite.status.value, 0) + 1
 
     return {
         "job_id": job_id,
@@ -484,7 +514,7 @@ async def debug_job(
                 "tokens": r.tokens_completion,
                 "duration_ms": r.duration_ms,
             }
-            for r in rewrites
+            for r in result.all()
         ],
     }
 
@@ -531,8 +561,8 @@ async def delete_job(
         )
 
     # Audit BEFORE delete so the event is part of the same transaction
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="job.deleted",
         actor_id=current_user.id,
         actor_username=current_user.username,
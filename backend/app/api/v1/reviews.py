@@ -6,31 +6,44 @@ from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.deps import CurrentUser, ReviewerUser, get_db
 from app.core.errors import ConflictError, ErrorCode, NotFoundError
-from app.db.models.job import JobStatus, RewriteJob, RewriteStatus, RiskSeverity, SectionRewrite
+from app.db.models.job import (
+    JobStatus,
+    RewriteJob,
+    RewriteStatus,
+    RiskFinding,
+    RiskSeverity,
+    SectionRewrite,
+)
 from app.db.models.review import Review, ReviewComment, ReviewStatus
 from app.schemas.job import RiskFindingOut
 from app.schemas.review import (
     AddCommentRequest,
+    DiffHunk,
     ReviewCommentOut,
     ReviewDecisionRequest,
     ReviewOut,
 )
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 from app.services.llm.prompt_engine import _strip_trailing_metadata, strip_markdown
-from app.services.review.diff import diff_to_json, generate_diff, json_to_diff
+from app.services.review.diff import generate_diff_json
 
 _log = structlog.get_logger(__name__)
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
+# Stored diffs validate from their JSON text straight into response models,
+# with no intermediate dataclasses or dicts
+_diff_hunks = TypeAdapter(list[DiffHunk])
+
 
 def _build_review_out(review: Review, rewrite: SectionRewrite | None = None) -> ReviewOut:
-    hunks = json_to_diff(review.diff_json) if review.diff_json else []
+    hunks = _diff_hunks.validate_json(review.diff_json) if review.diff_json else []
     original_text: str | None = None
     rewritten_text: str | None = None
     risk_findings: list[RiskFindingOut] = []
@@ -53,11 +66,7 @@ def _build_review_out(review: Review, rewrite: SectionRewrite | None = None) ->
         edited_text=review.edited_text,
         original_text=original_text,
         rewritten_text=rewritten_text,
-        diff_hunks=[
-            {"index": h.index, "operation": h.operation,
-             "original": h.original, "rewritten": h.rewritten}
-            for h in hunks
-        ],
+        diff_hunks=hunks,
         risk_override_reason=review.risk_override_reason,
         risk_findings=risk_findings,
         comments=[ReviewCommentOut.model_validate(c) for c in (review.comments or [])],
@@ -82,45 +91,48 @@ async def get_or_create_review(
 
     This is the entry point for the reviewer's diff view.
     """
-    rewrite_result = await db.execute(
-        select(SectionRewrite)
-        .where(SectionRewrite.id == rewrite_id)
-        .options(
-            selectinload(SectionRewrite.section),
-            selectinload(SectionRewrite.risk_findings)
+    # Rewrite and its review (if any) in one round-trip, with everything the
+    # response needs eagerly loaded
+    row = (
+        await db.execute(
+            select(SectionRewrite, Review)
+            .outerjoin(Review, Review.rewrite_id == SectionRewrite.id)
+            .where(SectionRewrite.id == rewrite_id)
+            .options(
+                selectinload(SectionRewrite.section),
+                selectinload(SectionRewrite.risk_findings),
+                selectinload(Review.comments),
+                # Anything else _build_review_out touches would lazy-load
+                raiseload("*"),
+            )
         )
-    )
-    rewrite = rewrite_result.scalar_one_or_none()
-    if rewrite is None:
+    ).one_or_none()
+    if row is None:
         raise NotFoundError("SectionRewrite", rewrite_id)
-
-    result = await db.execute(select(Review).where(Review.rewrite_id == rewrite_id))
-    review: Review | None = result.scalar_one_or_none()
+    rewrite: SectionRewrite = row.SectionRewrite
+    review: Review | None = row.Review
 
     if review is None:
         # Create the review record with a precomputed diff
         original = rewrite.section.original_text if rewrite.section else ""
         rewritten = rewrite.rewritten_text or ""
-        diff_hunks = generate_diff(original, rewritten)
 
         review = Review(
             rewrite_id=rewrite_id,
             reviewer_id=current_user.id,
             status=ReviewStatus.PENDING,
-            diff_json=diff_to_json(diff_hunks),
+            diff_json=generate_diff_json(original, rewritten),
+            comments=[],
         )
         db.add(review)
         await db.flush()
-        await db.refresh(review, ["comments"])
 
     else:
-        await db.refresh(review, ["comments"])
         # After a re-run the diff is cleared; regenerate it now that the
         # rewrite has a fresh completed text to compare against.
         if review.diff_json is None and rewrite.rewritten_text:
             original = rewrite.section.original_text if rewrite.section else ""
-            diff_hunks = generate_diff(original, rewrite.rewritten_text)
-            review.diff_json = diff_to_json(diff_hunks)
+            review.diff_json = generate_diff_json(original, rewrite.rewritten_text)
             # If the reviewer previously requested a rerun and it has now
             # completed, bring the review back to PENDING so it can be decided.
             if review.status == ReviewStatus.RERUN_REQUESTED:
@@ -170,23 +182,36 @@ async def decide_review(
             f"Review is already in status '{review.status}' and cannot be changed.",
         )
 
-    # Enforce risk override reason for critical findings
-    if body.status == ReviewStatus.APPROVED:
-        rw_result = await db.execute(
+    # Enforce risk override reason for critical findings. One indexed count,
+    # run only when it can block, before the rewrite is loaded at all
+    if body.status == ReviewStatus.APPROVED and not body.risk_override_reason:
+        critical = await db.scalar(
+            select(func.count())
+            .select_from(RiskFinding)
+            .where(
+                RiskFinding.rewrite_id == review.rewrite_id,
+                RiskFinding.severity.in_((RiskSeverity.CRITICAL, RiskSeverity.HIGH)),
+            )
+        )
+        if critical:
+            raise ConflictError(
+                ErrorCode.REVIEW_REWRITE_PENDING,
+                f"This rewrite has {critical} CRITICAL/HIGH risk finding(s). "
+                "Provide a risk_override_reason to override.",
+            )
+
+    # One load of the rewrite serves the edited-text diff and the response
+    rewrite = (
+        await db.execute(
             select(SectionRewrite)
             .where(SectionRewrite.id == review.rewrite_id)
-            .options(selectinload(SectionRewrite.risk_findings))
+            .options(
+                selectinload(SectionRewrite.section),
+                selectinload(SectionRewrite.risk_findings),
+                raiseload("*"),
+            )
         )
-        rewrite_check = rw_result.scalar_one_or_none()
-        if rewrite_check and rewrite_check.risk_findings:
-            critical = [f for f in rewrite_check.risk_findings 
-                       if f.severity in (RiskSeverity.CRITICAL, RiskSeverity.HIGH)]
-            if critical and not body.risk_override_reason:
-                raise ConflictError(
-                    ErrorCode.REVIEW_REWRITE_PENDING,
-                    f"This rewrite has {len(critical)} CRITICAL/HIGH risk finding(s). "
-                    "Provide a risk_override_reason to override.",
-                )
+    ).scalar_one_or_none()
 
     # ── Re-run path ────────────────────────────────────────────────────────────
     # When a reviewer requests a rerun we reset the associated SectionRewrite and
@@ -194,16 +219,12 @@ async def decide_review(
     # on the next WebSocket connection.  The review's diff/edited text are cleared
     # and will be regenerated by get_or_create_review once the new rewrite lands.
     if body.status == ReviewStatus.RERUN_REQUESTED:
-        rewrite_rr_result = await db.execute(
-            select(SectionRewrite).where(SectionRewrite.id == review.rewrite_id)
-        )
-        rewrite_rr = rewrite_rr_result.scalar_one_or_none()
-        if rewrite_rr is not None:
-            rewrite_rr.status = RewriteStatus.PENDING
-            rewrite_rr.rewritten_text = None
-            rewrite_rr.error_message = None
-            rewrite_rr.attempt_number = 0
-            job_rr = await db.get(RewriteJob, rewrite_rr.job_id)
+        if rewrite is not None:
+            rewrite.status = RewriteStatus.PENDING
+            rewrite.rewritten_text = None
+            rewrite.error_message = None
+            rewrite.attempt_number = 0
+            job_rr = await db.get(RewriteJob, rewrite.job_id)
             if job_rr is not None:
                 job_rr.status = JobStatus.PENDING
                 job_rr.error_message = None
@@ -213,18 +234,18 @@ async def decide_review(
         review.diff_json = None
         review.edited_text = None
         review.risk_override_reason = None
-        audit_rr = AuditLogger(db)
-        await audit_rr.log(
+        await audit_log(
+            db,
             event_type="review.rerun_requested",
             actor_id=current_user.id,
             actor_username=current_user.username,
             entity_type="Review",
             entity_id=review.id,
-            payload={"rewrite_id": review.rewrite_id, "job_id": rewrite_rr.job_id if rewrite_rr else None},
+            payload={"rewrite_id": review.rewrite_id, "job_id": rewrite.job_id if rewrite else None},
         )
         await db.commit()
         await db.refresh(review, ["comments"])
-        return _build_review_out(review, rewrite_rr)
+        return _build_review_out(review, rewrite)
 
     review.status = body.status
     review.reviewer_id = current_user.id
@@ -241,18 +262,11 @@ async def decide_review(
     if body.status == ReviewStatus.EDITED and body.edited_text:
         review.edited_text = body.edited_text
         # Recompute diff against edited text
-        rewrite_result2 = await db.execute(
-            select(SectionRewrite)
-            .where(SectionRewrite.id == review.rewrite_id)
-            .options(selectinload(SectionRewrite.section))
-        )
-        rewrite_for_diff = rewrite_result2.scalar_one_or_none()
-        if rewrite_for_diff and rewrite_for_diff.section:
-            diff_hunks = generate_diff(rewrite_for_diff.section.original_text, body.edited_text)
-            review.diff_json = diff_to_json(diff_hunks)
+        if rewrite and rewrite.section:
+            review.diff_json = generate_diff_json(rewrite.section.original_text, body.edited_text)
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type=f"review.{body.status.value}",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -263,18 +277,7 @@ async def decide_review(
     await db.commit()
     await db.refresh(review, ["comments"])
 
-    # Load rewrite with risk findings for the response
-    rewrite_response_result = await db.execute(
-        select(SectionRewrite)
-        .where(SectionRewrite.id == review.rewrite_id)
-        .options(
-            selectinload(SectionRewrite.section),
-            selectinload(SectionRewrite.risk_findings)
-        )
-    )
-    rewrite_for_response = rewrite_response_result.scalar_one_or_none()
-
-    return _build_review_out(review, rewrite_for_response)
+    return _build_review_out(review, rewrite)
 
 
 @router.post(
@@ -2,31 +2,40 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Mapping
-from typing import Annotated
-
+import asyncio
+import os
+import tempfile
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Any
+
+import orjson
 import structlog
 import yaml
-from fastapi import APIRouter, Depends, Query, Request, UploadFile
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import ValidationError as PydanticValidationError
-from sqlalchemy import func, select, delete
+from sqlalchemy import delete, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.datastructures import UploadFile as StarletteUploadFile
+from sqlalchemy.orm import raiseload
 
 from app.api.deps import AdminUser, CurrentUser, EditorUser, ReviewerUser, get_db
 from app.core.errors import ConflictError, ErrorCode, NotFoundError, ValidationError
+from app.core.uploads import receive_file_upload
 from app.db.models.ruleset import RuleConflict, Ruleset
+from app.db.session import window_total
 from app.schemas.ruleset import (
     ActivateRulesetResponse,
     DeactivateRulesetResponse,
     CreateRulesetRequest,
     RuleConflictOut,
+    RuleOut,
     RulesetListResponse,
     RulesetOut,
 )
-from app.services.audit.logger import AuditLogger
+from app.services.audit.logger import log as audit_log
 from app.services.rules.validator import (
+    canonical_json,
     compute_rules_hash,
     detect_rule_conflicts,
     validate_ruleset_dict,
@@ -35,26 +44,42 @@ from app.services.rules.validator import (
 _log = structlog.get_logger(__name__)
 router = APIRouter(prefix="/rulesets", tags=["rulesets"])
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Largest ruleset file accepted by multipart upload
+_MAX_RULESET_UPLOAD_BYTES = 2 * 1024 * 1024
 
-def _to_ruleset_out(rs: Ruleset) -> RulesetOut:
 
-    raw_rules: list[dict[str, object]] = []
+@lru_cache(maxsize=256)
+def _parse_rules(rules_json: str) -> tuple[RuleOut, ...]:
+    """
+    Parse a stored ``rules_json`` value into response rules.
+
+    Keyed on the JSON text itself, so an edited ruleset can never be served
+    stale rules; repeat list/get requests skip the parse and re-validation.
+    """
     try:
-        parsed = json.loads(rs.rules_json or "[]")
-        if isinstance(parsed, list):
-            raw_rules = [r for r in parsed if isinstance(r, dict)]
+        parsed = orjson.loads(rules_json)
     except Exception:
-        raw_rules = []
+        return ()
+    if not isinstance(parsed, list):
+        return ()
+    return tuple(
+        RuleOut(
+            id=str(rule.get("id", "")),
+            name=str(rule.get("name", "")),
+            instruction=str(rule.get("instruction", "")),
+        )
+        for rule in parsed
+        if isinstance(rule, dict)
+    )
 
-    rules = [
-        {
-            "id": str(rule.get("id", "")),
-            "name": str(rule.get("name", "")),
-            "instruction": str(rule.get("instruction", "")),
-        }
-        for rule in raw_rules
-    ]
 
+def _to_ruleset_out(rs: Ruleset, rules: Sequence[RuleOut] | None = None) -> RulesetOut:
+    """``rules`` may be passed when the caller already has them parsed."""
+    if rules is None:
+        rules = _parse_rules(rs.rules_json or "[]")
     return RulesetOut(
         id=rs.id,
         name=rs.name,
@@ -64,20 +89,41 @@ def _to_ruleset_out(rs: Ruleset) -> RulesetOut:
         schema_version=rs.schema_version,
         content_hash=rs.content_hash,
         is_active=rs.is_active,
-        rules=rules,
+        rules=list(rules),
         created_by=rs.created_by,
         created_at=rs.created_at,
         updated_at=rs.updated_at,
     )
 
 
+def _ruleset_document(
+    body: CreateRulesetRequest,
+) -> tuple[dict[str, Any], str, list[RuleOut]]:
+    """
+    Build the hashed document, the stored ``rules_json`` and response rules.
+
+    The rules are dumped once; that list is the ``rules`` entry of the
+    hashed document, and its canonical JSON is what gets stored.
+    """
+    rules_list = [r.model_dump(exclude_none=True) for r in body.rules]
+    document = {
+        "name": body.name,
+        "description": body.description,
+        "version": body.version,
+        "jurisdiction": body.jurisdiction,
+        "rules": rules_list,
+    }
+    rules_out = [RuleOut(id=r.id, name=r.name, instruction=r.instruction) for r in body.rules]
+    return document, canonical_json(rules_list), rules_out
+
+
 async def _resolve_create_body(
     request: Request,
 ) -> CreateRulesetRequest:
     content_type = (request.headers.get("content-type") or "").lower()
     if "multipart/form-data" not in content_type:
         try:
-            payload = await request.json()
+            payload = orjson.loads(await request.body())
         except Exception as exc:
             raise ValidationError("Invalid JSON body") from exc
 
@@ -86,23 +132,31 @@ async def _resolve_create_body(
         except PydanticValidationError as exc:
             raise ValidationError("JSON does not match ruleset schema", detail={"errors": exc.errors()}) from exc
 
-    form = await request.form()
-    file_obj = form.get("file")
-    if not isinstance(file_obj, (UploadFile, StarletteUploadFile)):
-        raise ValidationError("Multipart upload must include a 'file' field")
+    # Streamed to a scratch file under a size cap instead of being spooled by
+    # the form parser and then read back into memory whole
+    fd, scratch_name = tempfile.mkstemp(suffix=".ruleset")
+    os.close(fd)
+    scratch = Path(scratch_name)
+    try:
+        upload = await receive_file_upload(
+            request, "file", scratch, _MAX_RULESET_UPLOAD_BYTES
+        )
 
-    filename = (file_obj.filename or "").lower()
-    if not filename.endswith((".yaml", ".yml", ".json")):
-        raise ValidationError("Only .yaml, .yml, or .json files are supported")
+        filename = (upload.filename or "").lower()
+        if not filename.endswith((".yaml", ".yml", ".json")):
+            raise ValidationError("Only .yaml, .yml, or .json files are supported")
 
-    raw_bytes = await file_obj.read()
-    if not raw_bytes:
-        raise ValidationError("Uploaded YAML file is empty")
+        if not upload.size_bytes:
+            raise ValidationError("Uploaded YAML file is empty")
 
-    try:
-        parsed = yaml.safe_load(raw_bytes.decode("utf-8"))
-    except Exception as exc:
-        raise ValidationError("Invalid YAML file", detail={"error": str(exc)}) from exc
+        try:
+            # PyYAML decodes the byte stream itself (UTF-8 or BOM-marked UTF-16)
+            with scratch.open("rb") as f:
+                parsed = await asyncio.to_thread(yaml.load, f, Loader=_YamlLoader)
+        except Exception as exc:
+            raise ValidationError("Invalid YAML file", detail={"error": str(exc)}) from exc
+    finally:
+        scratch.unlink(missing_ok=True)
 
     if not isinstance(parsed, Mapping):
         raise ValidationError("YAML root must be an object/mapping")
@@ -133,14 +187,8 @@ async def create_ruleset(
     """
     resolved_body = await _resolve_create_body(request)
 
-    rules_list = [r.model_dump(exclude_none=True) for r in resolved_body.rules]
-    full_dict = {
-        "name": resolved_body.name,
-        "description": resolved_body.description,
-        "version": resolved_body.version,
-        "jurisdiction": resolved_body.jurisdiction,
-        "rules": rules_list,
-    }
+    full_dict, rules_json, rules_out = _ruleset_document(resolved_body)
+    rules_list = full_dict["rules"]
 
     schema_errors = validate_ruleset_dict(full_dict)
     if schema_errors:
@@ -173,7 +221,7 @@ async def create_ruleset(
         schema_version="1.0",
         content_hash=content_hash,
         is_active=False,
-        rules_json=json.dumps(rules_list),
+        rules_json=rules_json,
         created_by=current_user.id,
     )
     db.add(ruleset)
@@ -191,8 +239,8 @@ async def create_ruleset(
             )
         )
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="ruleset.created",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -213,7 +261,7 @@ async def create_ruleset(
             conflicts=len(conflicts),
         )
 
-    return _to_ruleset_out(ruleset)
+    return _to_ruleset_out(ruleset, rules_out)
 
 
 @router.get(
@@ -225,16 +273,28 @@ async def create_ruleset(
 async def list_rulesets(
     db: Annotated[AsyncSession, Depends(get_db)],
     active_only: bool = Query(default=False),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=100, ge=1, le=500),
 ) -> RulesetListResponse:
-    query = select(Ruleset).where(Ruleset.deleted_at.is_(None))
+    filters = [Ruleset.deleted_at.is_(None)]
     if active_only:
-        query = query.where(Ruleset.is_active.is_(True))
+        filters.append(Ruleset.is_active.is_(True))
 
-    count = await db.execute(select(func.count()).select_from(query.subquery()))
-    result = await db.execute(query.order_by(Ruleset.created_at.desc()))
+    # Page and total in one round-trip via a window count
+    result = await db.execute(
+        select(Ruleset, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Ruleset.created_at.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    rows = result.all()
+    total = await window_total(
+        db, rows, page, select(func.count()).select_from(Ruleset).where(*filters)
+    )
     return RulesetListResponse(
-        items=[_to_ruleset_out(r) for r in result.scalars().all()],
-        total=count.scalar_one(),
+        items=[_to_ruleset_out(row.Ruleset) for row in rows],
+        total=total,
     )
 
 
@@ -248,7 +308,8 @@ async def get_ruleset(
     ruleset_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> RulesetOut:
-    rs = await db.get(Ruleset, ruleset_id)
+    # _to_ruleset_out reads columns only; fail loudly if that ever changes
+    rs = await db.get(Ruleset, ruleset_id, options=[raiseload("*")])
     if rs is None or rs.is_deleted:
         raise NotFoundError("Ruleset", ruleset_id)
     return _to_ruleset_out(rs)
@@ -268,7 +329,9 @@ async def get_conflicts(
     if rs is None or rs.is_deleted:
         raise NotFoundError("Ruleset", ruleset_id)
     result = await db.execute(
-        select(RuleConflict).where(RuleConflict.ruleset_id == ruleset_id)
+        select(RuleConflict)
+        .where(RuleConflict.ruleset_id == ruleset_id)
+        .options(raiseload("*"))
     )
     return [RuleConflictOut.model_validate(c) for c in result.scalars().all()]
 
@@ -296,21 +359,23 @@ async def activate_ruleset(
     if rs.is_active:
         raise ConflictError(ErrorCode.RULE_ALREADY_ACTIVE, "Ruleset is already active.")
 
-    unresolved = await db.execute(
-        select(RuleConflict).where(
-            RuleConflict.ruleset_id == ruleset_id,
-            RuleConflict.is_resolved.is_(False),
+    has_unresolved = await db.scalar(
+        select(
+            exists().where(
+                RuleConflict.ruleset_id == ruleset_id,
+                RuleConflict.is_resolved.is_(False),
+            )
         )
     )
-    if list(unresolved.scalars().all()):
+    if has_unresolved:
         raise ConflictError(
             ErrorCode.RULE_CONFLICTS_PRESENT,
             "Cannot activate ruleset with unresolved conflicts. Resolve or dismiss them first.",
         )
 
     rs.is_active = True
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="ruleset.activated",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -346,8 +411,8 @@ async def deactivate_ruleset(
         raise ConflictError(ErrorCode.RULE_ALREADY_ACTIVE, "Ruleset is not active.")
 
     rs.is_active = False
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="ruleset.deactivated",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -379,21 +444,15 @@ async def update_ruleset(
     if rs.is_active:
         raise ConflictError(ErrorCode.RULE_ALREADY_ACTIVE, "Cannot edit an active ruleset.")
 
-    rules_list = [r.model_dump(exclude_none=True) for r in body.rules]
-    full_dict = {
-        "name": body.name,
-        "description": body.description,
-        "version": body.version,
-        "jurisdiction": body.jurisdiction,
-        "rules": rules_list,
-    }
+    full_dict, rules_json, rules_out = _ruleset_document(body)
+    rules_list = full_dict["rules"]
     content_hash = compute_rules_hash(full_dict)
 
     rs.name = body.name
     rs.description = body.description or ""
     rs.jurisdiction = body.jurisdiction
     rs.version = body.version
-    rs.rules_json = json.dumps(rules_list)
+    rs.rules_json = rules_json
     rs.content_hash = content_hash
 
     # Delete old conflicts
@@ -411,8 +470,8 @@ async def update_ruleset(
             )
         )
 
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="ruleset.updated",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -421,7 +480,7 @@ async def update_ruleset(
     )
     await db.commit()
     await db.refresh(rs)
-    return _to_ruleset_out(rs)
+    return _to_ruleset_out(rs, rules_out)
 
 
 @router.delete(
@@ -440,8 +499,8 @@ async def delete_ruleset(
         raise NotFoundError("Ruleset", ruleset_id)
 
     rs.soft_delete()
-    audit = AuditLogger(db)
-    await audit.log(
+    await audit_log(
+        db,
         event_type="ruleset.deleted",
         actor_id=current_user.id,
         actor_username=current_user.username,
@@ -9,10 +9,9 @@ from __future__ import annotations
 
 import structlog
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
-from jose import JWTError
+from jwt import InvalidTokenError
 
 from app.core.security import verify_ws_ticket
-from app.db.session import get_session_factory
 from app.services.llm.orchestrator import RewriteOrchestrator
 
 _log = structlog.get_logger(__name__)
@@ -38,27 +37,26 @@ async def job_stream(
     try:
         payload = verify_ws_ticket(ticket)
         user_id: str = payload["sub"]  # type: ignore[assignment]
-    except (JWTError, KeyError):
+    except (InvalidTokenError, KeyError):
         await websocket.close(code=4001, reason="Authentication failed")
         return
 
     await websocket.accept()
     _log.info("ws_client_connected", job_id=job_id, user_id=user_id)
 
-    factory = get_session_factory()
     try:
-        async with factory() as db:
-            orch = RewriteOrchestrator(db)
-            async for update in orch.run(job_id):
-                try:
-                    await websocket.send_json(update.model_dump())
-                except WebSocketDisconnect:
-                    _log.info("ws_client_disconnected_during_job", job_id=job_id)
-                    return
+        # The orchestrator checks sessions out of the pool per unit of work,
+        # so a connected client holds no database connection while streaming
+        orch = RewriteOrchestrator()
+        async for update in orch.run(job_id):
+            try:
+                # Serialized in one pydantic-core pass, still as a text frame
+                await websocket.send_text(update.model_dump_json())
+            except WebSocketDisconnect:
+                _log.info("ws_client_disconnected_during_job", job_id=job_id)
+                return
 
-            # Ensure final job status is persisted
-            await db.commit()
-            await websocket.send_json({"done": True, "job_id": job_id})
+        await websocket.send_json({"done": True, "job_id": job_id})
 
     except WebSocketDisconnect:
         _log.info("ws_client_disconnected", job_id=job_id)
@@ -2,31 +2,99 @@
 
 from __future__ import annotations
 
+import contextvars
 import logging
+import logging.handlers
+import queue
 import sys
+from contextvars import ContextVar
 from typing import Any
 
+import orjson
 import structlog
 
+# (user_id, username) of the authenticated caller. Set with a single
+# ContextVar.set() per request instead of copying structlog's context dict.
+current_log_user: ContextVar[tuple[str, str] | None] = ContextVar(
+    "current_log_user", default=None
+)
+
+
+def _add_current_user(_logger: Any, _method: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Processor that adds user_id / username when a caller is authenticated."""
+    user = current_log_user.get()
+    if user is not None:
+        event_dict.setdefault("user_id", user[0])
+        event_dict.setdefault("username", user[1])
+    return event_dict
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue records unformatted, with the emitting task's context attached.
+
+    Formatting and the stream write happen on the listener thread. The stock
+    QueueHandler formats in prepare() (so records can be pickled to another
+    process), which would leave that work on the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Foreign (stdlib) records get their contextvars merged in the
+        # formatter's pre-chain, which must see the caller's context
+        record.log_context = contextvars.copy_context()
+        # exc_info=True is resolved against sys.exc_info(), which is only
+        # meaningful on the emitting thread
+        if isinstance(record.msg, dict) and record.msg.get("exc_info") is True:
+            record.msg["exc_info"] = sys.exc_info()
+        return record
+
+
+class _ContextFormatter(structlog.stdlib.ProcessorFormatter):
+    def format(self, record: logging.LogRecord) -> str:
+        ctx: contextvars.Context | None = getattr(record, "log_context", None)
+        if ctx is None:
+            return super().format(record)
+        return ctx.run(super().format, record)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+_listener: logging.handlers.QueueListener | None = None
+
 
 def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     """
     Configure structlog for structured, levelled JSON or console logging.
 
-    Called once at application startup before any log statements.
+    Called once at application startup before any log statements. Records
+    are rendered and written by a background listener thread; call
+    :func:`stop_logging` at shutdown to drain it.
     """
+    global _listener
+    stop_logging()
+
     shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
+        _add_current_user,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
+    # Nothing in the app logs with stack_info=True; keep the per-record check
+    # for local console output and debug runs only
+    if not json_logs or log_level.upper() == "DEBUG":
+        shared_processors.append(structlog.processors.StackInfoRenderer())
 
+    renderers: list[Any]
     if json_logs:
-        renderer: Any = structlog.processors.JSONRenderer()
+        renderers = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ]
     else:
-        renderer = structlog.dev.ConsoleRenderer(colors=True)
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
 
     structlog.configure(
         processors=[
@@ -38,19 +106,23 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         cache_logger_on_first_use=True,
     )
 
-    formatter = structlog.stdlib.ProcessorFormatter(
+    formatter = _ContextFormatter(
         foreign_pre_chain=shared_processors,
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            renderer,
+            *renderers,
         ],
     )
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+
     root_logger = logging.getLogger()
-    root_logger.handlers = [handler]
+    root_logger.handlers = [_ContextQueueHandler(records)]
     root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
 
     # Suppress noisy third-party loggers
@@ -58,6 +130,16 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         logging.getLogger(noisy).setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Write out queued records and log directly from the caller from now on."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     """Return a bound structlog logger with the given name."""
     return structlog.get_logger(name)
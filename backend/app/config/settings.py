@@ -7,14 +7,14 @@ No defaults expose insecure behaviour in production.
 
 from __future__ import annotations
 
+import json
 from enum import StrEnum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import Any
+from urllib.parse import urlsplit
 
 from pydantic import (
-    AnyHttpUrl,
-    BeforeValidator,
     Field,
     SecretStr,
     field_validator,
@@ -41,13 +41,6 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
-def _parse_cors_origins(value: str | list[str]) -> list[str]:
-    """Accept comma-separated string or list for CORS origins."""
-    if isinstance(value, list):
-        return value
-    return [origin.strip() for origin in value.split(",") if origin.strip()]
-
-
 class Settings(BaseSettings):
     """
     Centralised, type-validated application configuration.
@@ -61,6 +54,12 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="forbid",
+        # List fields are split by split_list_values, which also accepts the
+        # comma-separated form; the env source would only take JSON arrays
+        enable_decoding=False,
+        # Built once, on the single get_settings() instantiation, rather than
+        # at import; modules that only import the class never pay for it
+        defer_build=True,
     )
 
     # ── Application ────────────────────────────────────────────────────── #
@@ -82,7 +81,7 @@ class Settings(BaseSettings):
     reload: bool = Field(default=False, description="Auto-reload on code change (dev only)")
 
     # ── CORS ───────────────────────────────────────────────────────────── #
-    cors_origins: Annotated[list[str], BeforeValidator(_parse_cors_origins)] = Field(
+    cors_origins: list[str] = Field(
         default=["http://localhost:5173"],
         description="Comma-separated list of allowed CORS origins",
     )
@@ -97,6 +96,19 @@ class Settings(BaseSettings):
     )
     db_pool_size: int = Field(default=5, ge=1, le=50, description="Connection pool size")
     db_max_overflow: int = Field(default=10, ge=0, le=100, description="Pool max overflow")
+    db_pool_use_lifo: bool = Field(
+        default=True,
+        description="Reuse the most recently returned connection first (LIFO)",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, ge=-1, description="Recycle connections older than N seconds (-1 = never)"
+    )
+    db_query_cache_size: int = Field(
+        default=1200, ge=0, description="Compiled SQL statement cache entries per engine"
+    )
     db_echo: bool = Field(default=False, description="Log all SQL statements (debug only)")
 
     # ── Auth / JWT ─────────────────────────────────────────────────────── #
@@ -117,9 +129,15 @@ class Settings(BaseSettings):
         le=30,
         description="Refresh token TTL in days",
     )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=10,
+        le=16,
+        description="bcrypt cost factor (log2 rounds) for newly hashed passwords",
+    )
 
     # ── Ollama ─────────────────────────────────────────────────────────── #
-    ollama_base_url: AnyHttpUrl = Field(
+    ollama_base_url: str = Field(
         default="http://127.0.0.1:11434",
         description="Ollama API base URL. Must resolve locally.",
     )
@@ -252,8 +270,46 @@ class Settings(BaseSettings):
         description="Bootstrap admin password. Required. Min 12 chars.",
     )
 
+    # ── Derived values ─────────────────────────────────────────────────── #
+
+    @cached_property
+    def is_production(self) -> bool:
+        return self.environment == Environment.PRODUCTION
+
+    @cached_property
+    def max_upload_bytes(self) -> int:
+        return self.max_upload_size_mb * 1024 * 1024
+
+    @cached_property
+    def jwt_access_token_expire_seconds(self) -> int:
+        return self.jwt_access_token_expire_minutes * 60
+
+    @cached_property
+    def csrf_token_expire_seconds(self) -> int:
+        return self.csrf_token_expire_minutes * 60
+
     # ── Validators ─────────────────────────────────────────────────────── #
 
+    @field_validator("cors_origins", "allowed_mime_types", mode="before")
+    @classmethod
+    def split_list_values(cls, v: Any) -> Any:
+        """Accept a JSON array or a comma-separated string for list fields."""
+        if not isinstance(v, str):
+            return v
+        v = v.strip()
+        if v.startswith("["):
+            return json.loads(v)
+        return [item.strip() for item in v.split(",") if item.strip()]
+
+    @field_validator("ollama_base_url")
+    @classmethod
+    def ollama_url_must_be_http(cls, v: str) -> str:
+        parts = urlsplit(v.strip())
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("ollama_base_url must be an http(s) URL with a host")
+        _ = parts.port  # raises ValueError on a malformed or out-of-range port
+        return parts.geturl()
+
     @field_validator("jwt_secret_key")
     @classmethod
     def jwt_secret_must_be_strong(cls, v: SecretStr) -> SecretStr:
@@ -279,12 +335,11 @@ class Settings(BaseSettings):
                 raise ValueError("db_echo must be False in production")
         return self
 
-    @model_validator(mode="after")
-    def ensure_directories_exist(self) -> Settings:
-        """Create storage directories if they do not exist."""
-        for directory in (self.upload_dir, self.export_dir, self.rules_dir):
-            directory.mkdir(parents=True, exist_ok=True)
-        return self
+
+def ensure_storage_dirs(settings: Settings) -> None:
+    """Create the storage directories if they do not exist; run at startup."""
+    for directory in (settings.upload_dir, settings.export_dir, settings.rules_dir):
+        directory.mkdir(parents=True, exist_ok=True)
 
 
 @lru_cache(maxsize=1)
@@ -89,7 +89,7 @@ class AppError(Exception):
     def to_dict(self) -> dict[str, Any]:
         return {
             "error": {
-                "code": self.code.value,
+                "code": self.code,
                 "message": self.message,
                 "detail": self.detail,
             }
@@ -138,6 +138,16 @@ class ValidationError(AppError):
         )
 
 
+class PayloadTooLargeError(AppError):
+    def __init__(self, limit_bytes: int) -> None:
+        super().__init__(
+            code=ErrorCode.DOC_TOO_LARGE,
+            message=f"Upload exceeds maximum allowed size of {limit_bytes // (1024 * 1024)}MB",
+            http_status=413,
+            detail={"limit_bytes": limit_bytes},
+        )
+
+
 class ConflictError(AppError):
     def __init__(self, code: ErrorCode, message: str) -> None:
         super().__init__(code=code, message=message, http_status=409)
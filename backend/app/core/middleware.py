@@ -7,21 +7,41 @@ consistent JSON responses. Injects correlation IDs into every request.
 
 from __future__ import annotations
 
+import os
 import time
-import uuid
-from collections.abc import Awaitable, Callable
 
+import orjson
 import structlog
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.errors import AppError, ErrorCode
+from app.config.logging_config import current_log_user
+from app.core.errors import AppError, ErrorCode, PayloadTooLargeError
 
 _log = structlog.get_logger(__name__)
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+# Correlation ids need uniqueness, not a fresh getrandom() call each: random
+# bytes are drawn from the OS for 256 ids at a time
+_ID_POOL_BYTES = 16 * 256
+_id_pool = b""
+_id_pos = 0
+
+
+def new_correlation_id() -> str:
+    """Return a random (version 4) UUID string."""
+    global _id_pool, _id_pos
+    if _id_pos >= len(_id_pool):
+        _id_pool = os.urandom(_ID_POOL_BYTES)
+        _id_pos = 0
+    h = _id_pool[_id_pos : _id_pos + 16].hex()
+    _id_pos += 16
+    # Version nibble 4 and RFC 4122 variant bits, formatted as str(uuid4())
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+class CorrelationIDMiddleware:
     """
     Injects a correlation ID into every request/response cycle.
 
@@ -29,55 +49,120 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     present; otherwise a new UUID4 is generated. The ID is bound to
     structlog context so that all log statements within the request
     automatically include it.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``, so a request costs no
+    extra task group or response stream.
     """
 
     HEADER = "X-Correlation-ID"
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        correlation_id = request.headers.get(self.HEADER) or str(uuid.uuid4())
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = Headers(scope=scope).get(self.HEADER) or new_correlation_id()
+        current_log_user.set(None)
+        # Kept on the scope itself so the error handlers read it with a plain
+        # dict lookup
+        scope["correlation_id"] = correlation_id
+        status_code = 0
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[self.HEADER] = correlation_id
+            await send(message)
+
+        # Each request runs in its own copied context, so binding and
+        # unbinding just these keys is enough; no need to clear the rest
+        with structlog.contextvars.bound_contextvars(
             correlation_id=correlation_id,
-            method=request.method,
-            path=request.url.path,
-        )
-        request.state.correlation_id = correlation_id
+            method=scope["method"],
+            path=scope["path"],
+        ):
+            start = time.perf_counter()
+            await self.app(scope, receive, send_with_id)
+            duration_ms = int((time.perf_counter() - start) * 1000)
+
+            _log.info(
+                "request_completed",
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
+
+
+# Encoded once; no route sets any of these, so they are appended to the raw
+# header list as-is
+_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    (b"cache-control", b"no-store"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Adds security-relevant HTTP response headers to every response."""
 
-        start = time.perf_counter()
-        response = await call_next(request)
-        duration_ms = int((time.perf_counter() - start) * 1000)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response.headers[self.HEADER] = correlation_id
-        _log.info(
-            "request_completed",
-            status_code=response.status_code,
-            duration_ms=duration_ms,
-        )
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Adds security-relevant HTTP response headers to every response."""
+        await self.app(scope, receive, send_with_headers)
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        response.headers["Cache-Control"] = "no-store"
-        return response
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects requests whose declared Content-Length exceeds the upload limit.
+
+    Runs before the body is read, so an oversize upload is refused without
+    being received or spooled. Bodies sent without a Content-Length are
+    still bounded by the size check in :func:`app.core.uploads.receive_file_upload`.
+    """
+
+    # Headroom for multipart boundaries and part headers around the file
+    MULTIPART_OVERHEAD = 64 * 1024
+
+    def __init__(self, app: ASGIApp, max_upload_bytes: int) -> None:
+        self.app = app
+        self.max_body_bytes = max_upload_bytes + self.MULTIPART_OVERHEAD
+        self.max_upload_bytes = max_upload_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            content_length = Headers(scope=scope).get("content-length")
+            if (
+                content_length
+                and content_length.isdigit()
+                and int(content_length) > self.max_body_bytes
+            ):
+                exc = PayloadTooLargeError(self.max_upload_bytes)
+                response = await app_error_handler(Request(scope), exc)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
 
 
 # ── Exception handlers ────────────────────────────────────────────────── #
 
 
-async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
+async def app_error_handler(request: Request, exc: AppError) -> Response:
     """Convert a domain AppError to a structured JSON response."""
     _log.warning(
         "application_error",
@@ -85,28 +170,39 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
         message=exc.message,
         http_status=exc.http_status,
     )
-    return JSONResponse(
+    # orjson straight to bytes; ``default`` covers anything in ``detail``
+    # the encoder has no native type for, such as exceptions in pydantic
+    # error contexts
+    return Response(
+        content=orjson.dumps(exc.to_dict(), default=str),
         status_code=exc.http_status,
-        content=exc.to_dict(),
-        headers={"X-Correlation-ID": getattr(request.state, "correlation_id", "")},
+        media_type="application/json",
+        headers={"X-Correlation-ID": request.scope.get("correlation_id", "")},
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+# The catch-all response never varies, so its body is rendered once
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": ErrorCode.INTERNAL_ERROR.value,
+            "message": "An unexpected internal error occurred.",
+            "detail": {},
+        }
+    }
+)
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Catch-all handler for unexpected exceptions.
 
     Never leaks internal detail to the client.
     """
     _log.exception("unhandled_exception", exc_info=exc)
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content={
-            "error": {
-                "code": ErrorCode.INTERNAL_ERROR.value,
-                "message": "An unexpected internal error occurred.",
-                "detail": {},
-            }
-        },
-        headers={"X-Correlation-ID": getattr(request.state, "correlation_id", "")},
+        media_type="application/json",
+        headers={"X-Correlation-ID": request.scope.get("correlation_id", "")},
     )
@@ -6,12 +6,17 @@ Secrets are never logged. All operations are timing-safe.
 
 from __future__ import annotations
 
-import secrets
+import asyncio
+import functools
 import hashlib
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 
 import bcrypt
-from jose import jwt
+import jwt
 
 from app.config.settings import get_settings
 
@@ -21,8 +26,11 @@ from app.config.settings import get_settings
 
 def hash_password(plain: str) -> str:
     """Return a bcrypt hash of the given plaintext password."""
+    # The SHA-256 hex prefilter sidesteps bcrypt's 72-byte limit and is part
+    # of every stored hash; bcrypt's cost does not depend on the key length
     normalized = hashlib.sha256(plain.encode("utf-8")).hexdigest().encode("utf-8")
-    return bcrypt.hashpw(normalized, bcrypt.gensalt()).decode("utf-8")
+    rounds = get_settings().bcrypt_rounds
+    return bcrypt.hashpw(normalized, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -38,6 +46,52 @@ def verify_password(plain: str, hashed: str) -> bool:
         return False
 
 
+@functools.cache
+def dummy_password_hash() -> str:
+    """
+    A fixed hash of a random password, for checks against missing users.
+
+    Verifying against it costs the same as a real check, so login latency
+    does not reveal whether a username exists.
+    """
+    return hash_password(secrets.token_hex(32))
+
+
+# bcrypt is deliberately slow and CPU-bound; request handlers run it on a
+# dedicated pool so a burst of logins neither blocks the event loop nor
+# starves the default executor used for file I/O.
+_kdf_executor: ThreadPoolExecutor | None = None
+
+
+def _get_kdf_executor() -> ThreadPoolExecutor:
+    global _kdf_executor
+    if _kdf_executor is None:
+        _kdf_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="kdf"
+        )
+    return _kdf_executor
+
+
+async def hash_password_async(plain: str) -> str:
+    """Run :func:`hash_password` on the KDF thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_kdf_executor(), hash_password, plain)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """Run :func:`verify_password` on the KDF thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_kdf_executor(), verify_password, plain, hashed)
+
+
+def shutdown_kdf_executor() -> None:
+    """Stop the KDF thread pool; called on application shutdown."""
+    global _kdf_executor
+    if _kdf_executor is not None:
+        _kdf_executor.shutdown(wait=True)
+        _kdf_executor = None
+
+
 # ── JWT ───────────────────────────────────────────────────────────────── #
 
 
@@ -45,6 +99,34 @@ def _now_utc() -> datetime:
     return datetime.now(UTC)
 
 
+# 128-bit token ids; URL-safe base64 is 22 characters where hex was 32
+_JTI_BYTES = 16
+
+
+class _JwtParams(NamedTuple):
+    secret: bytes
+    algorithm: str
+    algorithms: list[str]
+    access_ttl: timedelta
+    refresh_ttl: timedelta
+    ws_ticket_ttl: timedelta
+
+
+@functools.cache
+def _jwt_params() -> _JwtParams:
+    """Signing key and lifetimes, resolved from settings once per process."""
+    settings = get_settings()
+    secret = settings.jwt_secret_key.get_secret_value().encode("utf-8")
+    return _JwtParams(
+        secret=secret,
+        algorithm=settings.jwt_algorithm,
+        algorithms=[settings.jwt_algorithm],
+        access_ttl=timedelta(minutes=settings.jwt_access_token_expire_minutes),
+        refresh_ttl=timedelta(days=settings.jwt_refresh_token_expire_days),
+        ws_ticket_ttl=timedelta(seconds=settings.ws_ticket_expire_seconds),
+    )
+
+
 def create_access_token(
     subject: str,
     role: str,
@@ -61,42 +143,34 @@ def create_access_token(
     Returns:
         Signed compact JWT string.
     """
-    settings = get_settings()
-    expire = _now_utc() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    params = _jwt_params()
+    now = _now_utc()
     payload: dict[str, object] = {
         "sub": subject,
         "role": role,
-        "iat": _now_utc(),
-        "exp": expire,
+        "iat": now,
+        "exp": now + params.access_ttl,
         "type": "access",
-        "jti": secrets.token_hex(16),
+        "jti": secrets.token_urlsafe(_JTI_BYTES),
     }
     if extra_claims:
         payload.update(extra_claims)
 
-    return jwt.encode(
-        payload,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithm=settings.jwt_algorithm,
-    )
+    return jwt.encode(payload, params.secret, algorithm=params.algorithm)
 
 
 def create_refresh_token(subject: str) -> str:
     """Create a signed JWT refresh token (no role claim)."""
-    settings = get_settings()
-    expire = _now_utc() + timedelta(days=settings.jwt_refresh_token_expire_days)
+    params = _jwt_params()
+    now = _now_utc()
     payload: dict[str, object] = {
         "sub": subject,
-        "iat": _now_utc(),
-        "exp": expire,
+        "iat": now,
+        "exp": now + params.refresh_ttl,
         "type": "refresh",
-        "jti": secrets.token_hex(16),
+        "jti": secrets.token_urlsafe(_JTI_BYTES),
     }
-    return jwt.encode(
-        payload,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithm=settings.jwt_algorithm,
-    )
+    return jwt.encode(payload, params.secret, algorithm=params.algorithm)
 
 
 def decode_token(token: str) -> dict[str, object]:
@@ -104,18 +178,17 @@ def decode_token(token: str) -> dict[str, object]:
     Decode and validate a JWT.
 
     Raises:
-        JWTError: If the token is invalid, expired, or tampered with.
+        jwt.InvalidTokenError: If the token is invalid, expired, or tampered with.
     """
-    settings = get_settings()
-    return jwt.decode(  # type: ignore[return-value]
-        token,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithms=[settings.jwt_algorithm],
-    )
+    params = _jwt_params()
+    return jwt.decode(token, params.secret, algorithms=params.algorithms)  # type: ignore[return-value]
 
 
 def generate_csrf_token() -> str:
     """Generate a cryptographically secure CSRF token."""
+    # Drawn straight from the OS per call: tokens are minted once per login,
+    # behind a bcrypt check, and a pre-filled buffer of secrets would be
+    # duplicated into every worker forked after it was filled
     return secrets.token_urlsafe(32)
 
 
@@ -134,38 +207,29 @@ def create_ws_ticket(user_id: str, role: str) -> str:
     Unlike access tokens, tickets are single-use and very short TTL,
     preventing exposure in server logs or browser history.
     """
-    settings = get_settings()
-    expire = _now_utc() + timedelta(seconds=settings.ws_ticket_expire_seconds)
+    params = _jwt_params()
+    now = _now_utc()
     payload: dict[str, object] = {
         "sub": user_id,
         "role": role,
-        "iat": _now_utc(),
-        "exp": expire,
+        "iat": now,
+        "exp": now + params.ws_ticket_ttl,
         "type": "ws_ticket",
-        "jti": secrets.token_hex(16),
+        "jti": secrets.token_urlsafe(_JTI_BYTES),
     }
-    return jwt.encode(
-        payload,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithm=settings.jwt_algorithm,
-    )
+    return jwt.encode(payload, params.secret, algorithm=params.algorithm)
 
 
 def verify_ws_ticket(ticket: str) -> dict[str, object]:
     """
     Decode and validate a WebSocket ticket.
 
-    Raises JWTError if invalid, expired, or not a ws_ticket type.
+    Raises jwt.InvalidTokenError if invalid, expired, or not a ws_ticket type.
     """
-    settings = get_settings()
-    payload = jwt.decode(
-        ticket,
-        settings.jwt_secret_key.get_secret_value(),
-        algorithms=[settings.jwt_algorithm],
-    )
+    params = _jwt_params()
+    payload = jwt.decode(ticket, params.secret, algorithms=params.algorithms)
     if payload.get("type") != "ws_ticket":
-        from jose import JWTError
-        raise JWTError("Not a WebSocket ticket")
+        raise jwt.InvalidTokenError("Not a WebSocket ticket")
     return payload  # type: ignore[return-value]
 
 
@@ -176,9 +240,13 @@ __all__ = [
     "create_refresh_token",
     "create_ws_ticket",
     "decode_token",
+    "dummy_password_hash",
     "generate_csrf_token",
     "hash_password",
+    "hash_password_async",
     "safe_str_compare",
+    "shutdown_kdf_executor",
     "verify_password",
+    "verify_password_async",
     "verify_ws_ticket",
 ]
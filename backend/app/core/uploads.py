@@ -0,0 +1,169 @@
+"""
+Streaming multipart upload receiver.
+
+FastAPI's ``UploadFile`` is filled by Starlette's form parser, which spools
+each file part to a SpooledTemporaryFile (on disk past 1 MB) before the
+endpoint runs; the endpoint then copies it again to its final location.
+:func:`receive_file_upload` instead parses the request body as it arrives
+and writes the one wanted file part straight to its destination, hashing
+and size-checking it on the way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi import Request
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.core.errors import PayloadTooLargeError, ValidationError
+
+if TYPE_CHECKING:
+    from python_multipart.multipart import MultipartCallbacks
+
+# Bytes buffered before each write to disk
+_WRITE_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class ReceivedFile:
+    filename: str | None
+    content_type: str | None
+    file_hash: str
+    size_bytes: int
+
+
+class _FileFieldCollector:
+    """Multipart parser callbacks that keep only the first part of one file field."""
+
+    def __init__(self, field_name: str) -> None:
+        self.field_name = field_name
+        self.found = False
+        # Set once the closing boundary has been parsed
+        self.complete = False
+        self.filename: str | None = None
+        self.content_type: str | None = None
+        # Data of the wanted part fed since it was last drained
+        self.pending: list[bytes] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._in_target = False
+
+    def callbacks(self) -> MultipartCallbacks:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_end": self.on_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._in_target = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        if self.found or name != self.field_name or b"filename" not in options:
+            return
+        self.found = True
+        self._in_target = True
+        self.filename = options[b"filename"].decode("utf-8", "replace")
+        content_type = self._headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1").strip() if content_type else None
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_target:
+            self.pending.append(data[start:end])
+
+    def on_part_end(self) -> None:
+        self._in_target = False
+
+    def on_end(self) -> None:
+        self.complete = True
+
+
+async def receive_file_upload(
+    request: Request, field_name: str, dest: Path, limit_bytes: int
+) -> ReceivedFile:
+    """
+    Stream the ``field_name`` file of a multipart request body to ``dest``.
+
+    Memory use is bounded by the write buffer regardless of file size. The
+    content hash is a 256-bit BLAKE2b digest (faster than SHA-256 on
+    64-bit). Other form fields are discarded. On any error nothing is left
+    at ``dest``.
+
+    Raises:
+        ValidationError: The body is not multipart, is malformed or
+            truncated, or has no such file field.
+        PayloadTooLargeError: The file exceeds ``limit_bytes``.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if content_type.lower() != b"multipart/form-data" or not boundary:
+        raise ValidationError("Expected a multipart/form-data request body.")
+
+    collector = _FileFieldCollector(field_name)
+    parser = MultipartParser(boundary, collector.callbacks())
+    hasher = hashlib.blake2b(digest_size=32)
+    size = 0
+    buffer = bytearray()
+    try:
+        with dest.open("wb") as out:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                for data in collector.pending:
+                    size += len(data)
+                    if size > limit_bytes:
+                        # Stop at the first chunk past the limit; bodies without a
+                        # Content-Length are not caught by UploadSizeLimitMiddleware
+                        raise PayloadTooLargeError(limit_bytes)
+                    hasher.update(data)
+                    buffer += data
+                collector.pending.clear()
+                if len(buffer) >= _WRITE_CHUNK_SIZE:
+                    await asyncio.to_thread(out.write, bytes(buffer))
+                    buffer.clear()
+            parser.finalize()
+            if buffer:
+                await asyncio.to_thread(out.write, bytes(buffer))
+        if not collector.complete:
+            # The parser accepts a body that stops short of its closing boundary
+            raise ValidationError("Incomplete multipart request body.")
+        if not collector.found:
+            raise ValidationError(f"Missing file field '{field_name}'.")
+    except FormParserError as exc:
+        dest.unlink(missing_ok=True)
+        raise ValidationError("Malformed multipart request body.") from exc
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
+
+    return ReceivedFile(
+        filename=collector.filename,
+        content_type=collector.content_type,
+        file_hash=hasher.hexdigest(),
+        size_bytes=size,
+    )
@@ -4,15 +4,62 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Dialect, LargeBinary, TypeDecorator, Uuid, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+_NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+class GUID(TypeDecorator[str]):
+    """
+    UUID column exposed to Python as a canonical string.
+
+    Stored as native ``uuid`` (16 bytes) on PostgreSQL and as CHAR(32) hex
+    elsewhere, so PK/FK indexes are far narrower than VARCHAR(36) while ORM
+    code keeps passing plain ``str`` ids around.
+    """
+
+    impl = Uuid(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            # A malformed id can never match a stored uuid4; bind the nil UUID
+            # so lookups miss (-> 404) instead of raising a driver DataError.
+            return _NIL_UUID
+
+
+class HexDigest(TypeDecorator[str]):
+    """
+    Fixed-width binary digest exposed to Python as lowercase hex.
+
+    Stores the raw bytes (``bytea``/BLOB), half the width of the hex text,
+    while code and API schemas keep handling the familiar hex string.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, length: int) -> None:
+        super().__init__(length)
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        return None if value is None else value.hex()
+
+
 class Base(DeclarativeBase):
     """Project-wide SQLAlchemy declarative base."""
 
@@ -20,6 +67,10 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Provides created_at / updated_at columns for any model."""
 
+    # The Python-side defaults are deliberate. The migrated tables carry no
+    # server defaults, func.now() is second-resolution on SQLite, and a
+    # server-generated value would expire the attribute after flush, which an
+    # async session cannot lazy-load back.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=_utcnow,
@@ -54,10 +105,10 @@ class SoftDeleteMixin:
 
 
 class UUIDPrimaryKeyMixin:
-    """Provides a UUID string primary key."""
+    """Provides a UUID primary key (exposed as a string)."""
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
     )
@@ -7,6 +7,7 @@ SectionType enumerates recognized structural elements.
 
 from __future__ import annotations
 
+from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
@@ -15,17 +16,20 @@ if TYPE_CHECKING:
 
 from sqlalchemy import (
     BigInteger,
+    DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy import (
     Enum as SAEnum,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
+from app.db.base import GUID, Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
 
 
 class DocumentStatus(StrEnum):
@@ -52,24 +56,54 @@ class Document(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     """Uploaded legal document."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Every list/dedup query filters on deleted_at IS NULL; index only
+        # live rows, in the order the list endpoint pages them
+        Index(
+            "ix_documents_live_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_documents_live_status_created_at",
+            "status",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # Upload dedup inserts with ON CONFLICT against this index
+        Index(
+            "ix_documents_live_file_hash",
+            "file_hash",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     filename: Mapped[str] = mapped_column(String(500), nullable=False)
     original_filename: Mapped[str] = mapped_column(String(500), nullable=False)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     file_size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    file_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    file_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     page_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     status: Mapped[DocumentStatus] = mapped_column(
         SAEnum(DocumentStatus, name="document_status"),
         default=DocumentStatus.PENDING,
         nullable=False,
-        index=True,
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_by: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True
+        GUID(), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True
+    )
+
+    # Overrides SoftDeleteMixin: the partial indexes above replace the plain
+    # deleted_at index
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
     )
 
     sections: Mapped[list[Section]] = relationship(
@@ -94,13 +128,13 @@ class Section(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "sections"
 
     document_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     parent_id: Mapped[str | None] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("sections.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
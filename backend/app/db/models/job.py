@@ -16,13 +16,15 @@ from sqlalchemy import (
 from sqlalchemy import (
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from app.db.base import GUID, Base, TimestampMixin, UUIDPrimaryKeyMixin
 
 
 class JobStatus(StrEnum):
@@ -59,15 +61,26 @@ class RewriteJob(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
 
     __tablename__ = "rewrite_jobs"
+    __table_args__ = (
+        # Small partial index for the "active work" lookups (startup recovery,
+        # one-running-job-per-document check); finished jobs are never scanned.
+        Index(
+            "ix_rewrite_jobs_active",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+            sqlite_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+        # list_jobs filters by document and/or status and pages by created_at
+        Index("ix_rewrite_jobs_document_status_created_at", "document_id", "status", "created_at"),
+    )
 
     document_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("documents.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
     ruleset_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("rulesets.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
@@ -80,7 +93,7 @@ class RewriteJob(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         index=True,
     )
     created_by: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True
+        GUID(), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     export_filename: Mapped[str | None] = mapped_column(String(500), nullable=True, default=None)
@@ -103,15 +116,20 @@ class SectionRewrite(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
 
     __tablename__ = "section_rewrites"
+    __table_args__ = (
+        # Every per-job lookup filters by job and usually by status (pending
+        # work, retries, progress counts, the status breakdown); the plain
+        # job_id index is a prefix of this one
+        Index("ix_section_rewrites_job_status", "job_id", "status"),
+    )
 
     job_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("rewrite_jobs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     section_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("sections.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
@@ -153,7 +171,7 @@ class RiskFinding(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "risk_findings"
 
     rewrite_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("section_rewrites.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -9,10 +9,10 @@ if TYPE_CHECKING:
     from app.db.models.job import SectionRewrite
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+from app.db.base import GUID, Base, TimestampMixin, UUIDPrimaryKeyMixin
 
 
 class ReviewStatus(StrEnum):
@@ -34,14 +34,14 @@ class Review(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "reviews"
 
     rewrite_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("section_rewrites.id", ondelete="RESTRICT"),
         nullable=False,
         unique=True,
         index=True,
     )
     reviewer_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
@@ -70,18 +70,18 @@ class ReviewComment(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "review_comments"
 
     review_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("reviews.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     parent_comment_id: Mapped[str | None] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("review_comments.id", ondelete="SET NULL"),
         nullable=True,
     )
     author_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
     )
@@ -7,10 +7,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from app.db.models.job import RewriteJob
 
-from sqlalchemy import Boolean, ForeignKey, String, Text, UniqueConstraint
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
+from app.db.base import GUID, Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
 
 
 class Ruleset(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
@@ -24,6 +26,13 @@ class Ruleset(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "rulesets"
     __table_args__ = (
         UniqueConstraint("name", "version", name="uq_rulesets_name_version"),
+        # The list endpoint pages live rulesets newest first
+        Index(
+            "ix_rulesets_live_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
     )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -36,7 +45,13 @@ class Ruleset(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     rules_json: Mapped[str] = mapped_column(Text, nullable=False)
 
     created_by: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
+        GUID(), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
+    )
+
+    # Overrides SoftDeleteMixin: the partial index above replaces the plain
+    # deleted_at index
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
     )
 
     conflicts: Mapped[list[RuleConflict]] = relationship(
@@ -58,7 +73,7 @@ class RuleConflict(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "rule_conflicts"
 
     ruleset_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("rulesets.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
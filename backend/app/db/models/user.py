@@ -7,12 +7,13 @@ stored as a string for schema portability across SQLite and PostgreSQL.
 
 from __future__ import annotations
 
+from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import Boolean, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
+from app.db.base import GUID, Base, SoftDeleteMixin, TimestampMixin, UUIDPrimaryKeyMixin
 
 
 class RoleEnum(StrEnum):
@@ -42,7 +43,16 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     """User entity with hashed password and role reference."""
 
     __tablename__ = "users"
-    __table_args__ = (UniqueConstraint("username", name="uq_users_username"),)
+    __table_args__ = (
+        UniqueConstraint("username", name="uq_users_username"),
+        # Every user lookup filters on deleted_at IS NULL; index only live rows
+        Index(
+            "ix_users_active",
+            "username",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     username: Mapped[str] = mapped_column(
         String(100), nullable=False, index=True
@@ -52,12 +62,18 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     role_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID(),
         ForeignKey("roles.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
     )
     role: Mapped[Role] = relationship("Role", back_populates="users")
 
+    # Overrides SoftDeleteMixin: the partial ix_users_active replaces the
+    # plain deleted_at index, which would be almost entirely NULLs
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
+
     def __repr__(self) -> str:
         return f"<User {self.username}>"
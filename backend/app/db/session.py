@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any
 
+from sqlalchemy import Select, insert
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -25,7 +26,12 @@ def _build_engine_kwargs(settings: Settings) -> dict[str, Any]:
     SQLite does not support pool_size / max_overflow; PostgreSQL does.
     """
     url = str(settings.database_url)
-    base: dict[str, Any] = {"echo": settings.db_echo}
+    base: dict[str, Any] = {
+        "echo": settings.db_echo,
+        # Larger than SQLAlchemy's default of 500 so the hot selects and the
+        # per-filter variants of the listing queries all stay compiled
+        "query_cache_size": settings.db_query_cache_size,
+    }
 
     if "sqlite" in url:
         # SQLite is single-writer; pool class is StaticPool for testing
@@ -33,7 +39,11 @@ def _build_engine_kwargs(settings: Settings) -> dict[str, Any]:
     else:
         base["pool_size"] = settings.db_pool_size
         base["max_overflow"] = settings.db_max_overflow
-        base["pool_pre_ping"] = True
+        # LIFO keeps traffic on the hottest connections (warm server-side
+        # caches) and lets surplus ones idle out
+        base["pool_use_lifo"] = settings.db_pool_use_lifo
+        base["pool_pre_ping"] = settings.db_pool_pre_ping
+        base["pool_recycle"] = settings.db_pool_recycle
 
     return base
 
@@ -83,6 +93,38 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def bulk_insert(
+    session: AsyncSession, model: type[Any], rows: Sequence[dict[str, Any]]
+) -> None:
+    """
+    Insert many rows of ``model`` in as few statements as the dialect allows.
+
+    Goes through Core ``insert()`` with a list of parameter dicts, so rows
+    are batched into multi-VALUES statements (insertmanyvalues) instead of
+    one flush per ORM object. Python-side column defaults still apply;
+    nothing is added to the session's identity map.
+    """
+    if rows:
+        await session.execute(insert(model), rows)
+
+
+async def window_total(
+    session: AsyncSession, rows: Sequence[Any], page: int, count_stmt: Select[Any]
+) -> int:
+    """
+    Return the total for a page fetched with a ``count().over()`` column named ``total``.
+
+    Any returned row carries the total, saving a separate COUNT. An empty
+    page past the first has no row to report it, so only then is
+    ``count_stmt`` run to tell "past the last page" from "nothing matches".
+    """
+    if rows:
+        return int(rows[0].total)
+    if page > 1:
+        return int((await session.execute(count_stmt)).scalar_one())
+    return 0
+
+
 async def dispose_engine() -> None:
     """Dispose the engine; used on application shutdown."""
     global _engine
@@ -3,11 +3,13 @@ FillWise 3.0 — FastAPI application factory.
 
 Application lifecycle:
   startup  → configure logging, run DB migrations, seed roles/admin
-  shutdown → dispose DB engine pool
+  shutdown → flush queued audit events, close the Ollama connection pool,
+             dispose DB engine pool, stop the password-hashing pool
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -19,16 +21,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from slowapi.middleware import SlowAPIASGIMiddleware
 from slowapi.util import get_remote_address
 
 from app.api.v1.router import router as v1_router
-from app.config.logging_config import configure_logging
-from app.config.settings import get_settings
+from app.config.logging_config import configure_logging, stop_logging
+from app.config.settings import ensure_storage_dirs, get_settings
 from app.core.errors import AppError
 from app.core.middleware import (
     CorrelationIDMiddleware,
     SecurityHeadersMiddleware,
+    UploadSizeLimitMiddleware,
     app_error_handler,
     unhandled_exception_handler,
 )
@@ -50,6 +53,7 @@ def _create_limiter() -> Limiter:
 async def _startup(app: FastAPI) -> None:
     settings = get_settings()
     configure_logging(log_level=settings.log_level.value, json_logs=settings.log_json)
+    ensure_storage_dirs(settings)
     _log.info(
         "fillwise_starting",
         version=settings.app_version,
@@ -59,10 +63,11 @@ async def _startup(app: FastAPI) -> None:
     from alembic.config import Config
     from alembic import command
 
-    # Run migrations synchronously (alembic/env.py now uses a sync engine)
+    # alembic/env.py drives its own event loop via asyncio.run(), so the
+    # upgrade runs in a worker thread rather than on this loop
     try:
         alembic_cfg = Config("alembic.ini")
-        command.upgrade(alembic_cfg, "head")
+        await asyncio.to_thread(command.upgrade, alembic_cfg, "head")
         _log.info("migrations_applied")
     except Exception as exc:
         logging.getLogger(__name__).warning("migration_warning: %s", exc)
@@ -70,9 +75,16 @@ async def _startup(app: FastAPI) -> None:
     # Seed roles and admin
     await _seed_database()
 
+    # Roles are fixed after seeding; keep name -> id in memory for handlers
+    app.state.role_ids = await _load_role_ids()
+
     # Recover any jobs left as RUNNING from a previous crash/restart
     await _recover_stale_jobs()
 
+    # Batch audit inserts off the request path from here on
+    from app.services.audit.logger import start_writer
+    start_writer()
+
     _log.info("fillwise_ready", host=settings.host, port=settings.port)
 
 
@@ -88,11 +100,17 @@ async def _seed_database() -> None:
     factory = get_session_factory()
 
     async with factory() as db:
-        # Upsert roles
-        for role_enum in RoleEnum:
-            result = await db.execute(select(Role).where(Role.name == role_enum.value))
-            if result.scalar_one_or_none() is None:
-                db.add(Role(name=role_enum.value, description=f"{role_enum.value} role"))
+        # Upsert roles: one query for all of them, then add the missing ones
+        role_names = [role_enum.value for role_enum in RoleEnum]
+        roles = {
+            role.name: role
+            for role in await db.scalars(select(Role).where(Role.name.in_(role_names)))
+        }
+        missing = [
+            Role(name=name, description=f"{name} role") for name in role_names if name not in roles
+        ]
+        db.add_all(missing)
+        roles.update((role.name, role) for role in missing)
 
         await db.flush()
 
@@ -101,13 +119,11 @@ async def _seed_database() -> None:
             select(User).where(User.username == settings.admin_username)
         )
         if admin_result.scalar_one_or_none() is None:
-            admin_role = await db.execute(select(Role).where(Role.name == RoleEnum.ADMIN.value))
-            role = admin_role.scalar_one()
             db.add(
                 User(
                     username=settings.admin_username,
                     password_hash=hash_password(settings.admin_password.get_secret_value()),
-                    role_id=role.id,
+                    role_id=roles[RoleEnum.ADMIN.value].id,
                     is_active=True,
                 )
             )
@@ -116,10 +132,30 @@ async def _seed_database() -> None:
         await db.commit()
 
 
+async def _load_role_ids() -> dict[str, str]:
+    """Return a name -> id map of all roles."""
+    from sqlalchemy import select
+
+    from app.db.models.user import Role
+    from app.db.session import get_session_factory
+
+    factory = get_session_factory()
+    async with factory() as db:
+        result = await db.execute(select(Role.name, Role.id))
+        return dict(result.all())
+
+
 async def _shutdown() -> None:
+    from app.core.security import shutdown_kdf_executor
     from app.db.session import dispose_engine
+    from app.services.audit.logger import stop_writer
+    from app.services.llm.client import close_ollama_client
+    await stop_writer()
+    await close_ollama_client()
     await dispose_engine()
+    shutdown_kdf_executor()
     _log.info("fillwise_shutdown")
+    stop_logging()
 
 
 async def _recover_stale_jobs() -> None:
@@ -169,9 +205,9 @@ def create_app() -> FastAPI:
             "All processing occurs on this machine; no data leaves the system."
         ),
         lifespan=_lifespan,
-        docs_url="/docs" if settings.environment.value != "production" else None,
-        redoc_url="/redoc" if settings.environment.value != "production" else None,
-        openapi_url="/openapi.json" if settings.environment.value != "production" else None,
+        docs_url="/docs" if not settings.is_production else None,
+        redoc_url="/redoc" if not settings.is_production else None,
+        openapi_url="/openapi.json" if not settings.is_production else None,
     )
 
     # ── Startup / Shutdown ────────────────────────────────────────────── #
@@ -181,7 +217,13 @@ def create_app() -> FastAPI:
     limiter = _create_limiter()
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-    app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(SlowAPIASGIMiddleware)
+
+    # Refuse oversize bodies before they are read (inside CORS so the 413
+    # still carries CORS headers)
+    app.add_middleware(
+        UploadSizeLimitMiddleware, max_upload_bytes=settings.max_upload_bytes
+    )
 
     # ── CORS ──────────────────────────────────────────────────────────── #
     app.add_middleware(
@@ -24,9 +24,14 @@ class AuditEventOut(BaseModel):
 
 class AuditListResponse(BaseModel):
     items: list[AuditEventOut]
-    total: int
+    total: int | None = Field(
+        description="Events matching the filters; null on cursor pages, which skip the count"
+    )
     page: int
     page_size: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as ?cursor= to fetch the next page; null on the last page"
+    )
 
 
 class ChainVerificationResult(BaseModel):
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json as _json
 from datetime import datetime
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from app.db.models.job import JobStatus, RewriteStatus, RiskSeverity
@@ -40,9 +40,9 @@ class RiskFindingOut(BaseModel):
             return v
         if isinstance(v, str):
             try:
-                parsed = _json.loads(v)
+                parsed = orjson.loads(v)
                 return parsed if isinstance(parsed, dict) else None
-            except (_json.JSONDecodeError, TypeError):
+            except orjson.JSONDecodeError:
                 return None
         return None
 
@@ -6,20 +6,33 @@ preceding event. This forms a cryptographic hash chain that makes
 tampering with historical records detectable.
 
 The chain is linear (single sequence). Thread safety is ensured by
-serialising writes via an asyncio lock.
+serialising writes via an asyncio lock; a session that adds an event
+itself holds that lock until its transaction ends, so no other write can
+chain onto the same head in the meantime.
+
+While the application is running, events are queued and written in
+batches by a background writer (see :func:`start_writer`), so audit
+inserts stay off the request path. An event is only queued once the
+caller's session commits; a rollback discards it. Callers pass
+``durable=True`` for events that must commit with the request's own
+transaction.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import json
-from datetime import UTC, datetime
+import uuid
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import event as sa_event
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.db.models.audit import AuditEvent
 
@@ -27,10 +40,31 @@ _log = structlog.get_logger(__name__)
 
 _LOCK: asyncio.Lock | None = None
 
+# Rows fetched per round-trip while walking the chain in verify_chain()
+_VERIFY_BATCH_SIZE = 1000
+
+# The background writer flushes after this many events or this long after
+# the first queued one, whichever comes first
+_WRITE_BATCH_SIZE = 100
+_WRITE_BATCH_WINDOW_S = 0.1
+
+# A failed batch is retried this many times, backing off between attempts,
+# before its events are written one at a time
+_WRITE_RETRIES = 3
+_WRITE_RETRY_DELAY_S = 0.5
+
+_queue: asyncio.Queue[dict[str, Any]] | None = None
+_writer: asyncio.Task[None] | None = None
+
+# Session.info keys: events waiting for the session to commit, and whether
+# the session holds the chain lock
+_PENDING_KEY = "audit_pending_events"
+_CHAIN_HELD_KEY = "audit_chain_held"
+
 
 def _get_lock() -> asyncio.Lock:
     """Lazily create the asyncio lock to avoid binding to a specific event loop at import time."""
-    global _LOCK  # noqa: PLW0603
+    global _LOCK
     if _LOCK is None:
         _LOCK = asyncio.Lock()
     return _LOCK
@@ -46,6 +80,9 @@ def _compute_event_hash(
     prev_hash: str | None,
 ) -> str:
     """Compute the SHA-256 hash for an audit event."""
+    if created_at.tzinfo is None:
+        # SQLite hands DateTime(timezone=True) back naive; values are UTC
+        created_at = created_at.replace(tzinfo=UTC)
     components = {
         "event_type": event_type,
         "actor_id": actor_id or "",
@@ -59,104 +96,300 @@ def _compute_event_hash(
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
-class AuditLogger:
+def _canonical_id(value: str | None) -> str | None:
+    """Canonical form of an actor/entity UUID, as the column reads it back."""
+    return str(uuid.UUID(value)) if value else None
+
+
+async def log(
+    db: AsyncSession,
+    *,
+    event_type: str,
+    actor_id: str | None = None,
+    actor_username: str | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    correlation_id: str | None = None,
+    payload: dict[str, Any] | None = None,
+    durable: bool = False,
+) -> AuditEvent | None:
     """
-    Service for writing immutable audit events.
+    Record a single audit event.
+
+    If the background writer is running and ``durable`` is false, None is
+    returned and the event is queued when ``db`` commits, then hashed and
+    inserted within about 100 ms; if ``db`` rolls back instead, the event
+    is discarded. Otherwise it is added to ``db`` without a flush, so its
+    INSERT goes out with the caller's own changes at commit (and rolls back
+    with them).
+
+    Stateless: the session is passed per call. Adding an event in-session
+    takes the chain lock until ``db``'s transaction ends, so prev_hash stays
+    the committed head even under concurrent requests and the background
+    writer. The caller must commit, roll back or close ``db`` promptly.
 
     Usage:
-        logger = AuditLogger(db)
-        await logger.log(
+        await audit_log(
+            db,
             event_type="document.uploaded",
-            actor=current_user,
+            actor_id=current_user.id,
+            actor_username=current_user.username,
             entity_type="Document",
             entity_id=doc.id,
             payload={"filename": doc.original_filename},
         )
     """
+    # Hash exactly what verify_chain will read back from the UUID columns
+    actor_id = _canonical_id(actor_id)
+    entity_id = _canonical_id(entity_id)
+    payload_json = json.dumps(payload, sort_keys=True) if payload else None
+    if _queue is not None and not durable:
+        # Queued by _queue_on_commit once the caller's transaction commits
+        db.info.setdefault(_PENDING_KEY, []).append(
+            {
+                "event_type": event_type,
+                "actor_id": actor_id,
+                "actor_username": actor_username,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "correlation_id": correlation_id,
+                "payload_json": payload_json,
+            }
+        )
+        return None
 
-    def __init__(self, db: AsyncSession) -> None:
-        self._db = db
-
-    async def log(
-        self,
-        event_type: str,
-        actor_id: str | None = None,
-        actor_username: str | None = None,
-        entity_type: str | None = None,
-        entity_id: str | None = None,
-        correlation_id: str | None = None,
-        payload: dict[str, Any] | None = None,
-    ) -> AuditEvent:
-        """
-        Write a single audit event to the database.
-
-        The lock ensures prev_hash is read and written atomically even
-        under concurrent requests, preserving chain integrity.
-        """
-        async with _get_lock():
-            prev_hash = await self._get_last_hash()
-            created_at = datetime.now(UTC)
-            payload_json = json.dumps(payload, sort_keys=True) if payload else None
-
-            event_hash = _compute_event_hash(
-                event_type=event_type,
-                actor_id=actor_id,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                payload_json=payload_json,
-                created_at=created_at,
-                prev_hash=prev_hash,
-            )
+    # Held until this session's transaction ends (_release_chain), so the
+    # head read here is still the head when the event commits
+    acquired = not db.info.get(_CHAIN_HELD_KEY)
+    if acquired:
+        await _get_lock().acquire()
+        db.info[_CHAIN_HELD_KEY] = True
+    try:
+        prev_hash = _pending_last_hash(db) or await _get_last_hash(db)
+        created_at = datetime.now(UTC)
 
-            event = AuditEvent(
-                event_type=event_type,
-                actor_id=actor_id,
-                actor_username=actor_username,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                correlation_id=correlation_id,
-                payload_json=payload_json,
-                event_hash=event_hash,
-                prev_hash=prev_hash,
-                created_at=created_at,
-            )
-            self._db.add(event)
-            await self._db.flush()
-
-            _log.debug(
-                "audit_event_written",
-                event_type=event_type,
-                actor_id=actor_id,
-                entity_id=entity_id,
-                event_hash=event_hash,
-            )
-            return event
-
-    async def _get_last_hash(self) -> str | None:
-        """Fetch the event_hash of the most recently written audit event."""
-        result = await self._db.execute(
-            select(AuditEvent.event_hash)
-            .order_by(AuditEvent.created_at.desc())
-            .limit(1)
+        event_hash = _compute_event_hash(
+            event_type=event_type,
+            actor_id=actor_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            payload_json=payload_json,
+            created_at=created_at,
+            prev_hash=prev_hash,
         )
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def verify_chain(db: AsyncSession) -> tuple[bool, str | None]:
-        """
-        Verify the integrity of the audit hash chain.
-
-        Returns:
-            (True, None) if chain is intact.
-            (False, event_id) of the first event where the chain is broken.
-        """
-        # Stream results to avoid loading entire audit history into memory
-        result = await db.stream(
-            select(AuditEvent).order_by(AuditEvent.created_at.asc())
+
+        event = AuditEvent(
+            event_type=event_type,
+            actor_id=actor_id,
+            actor_username=actor_username,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            correlation_id=correlation_id,
+            payload_json=payload_json,
+            event_hash=event_hash,
+            prev_hash=prev_hash,
+            created_at=created_at,
         )
+        db.add(event)
+    except BaseException:
+        if acquired:
+            db.info.pop(_CHAIN_HELD_KEY, None)
+            _get_lock().release()
+        raise
+
+    _log.debug(
+        "audit_event_written",
+        event_type=event_type,
+        actor_id=actor_id,
+        entity_id=entity_id,
+        event_hash=event_hash,
+    )
+    return event
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _queue_on_commit(session: Session) -> None:
+    """Hand a session's deferred events to the writer once it has committed."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _queue is None:
+        # The writer stopped while the request was in flight
+        _log.error("audit_events_dropped", count=len(pending), events=pending)
+        return
+    for item in pending:
+        _queue.put_nowait(item)
+
+
+@sa_event.listens_for(Session, "after_transaction_end")
+def _release_chain(session: Session, transaction: SessionTransaction) -> None:
+    """Drop uncommitted deferred events and release the chain lock."""
+    if transaction.parent is not None:
+        return
+    session.info.pop(_PENDING_KEY, None)
+    if session.info.pop(_CHAIN_HELD_KEY, False):
+        _get_lock().release()
+
+
+async def _write_batch(batch: list[dict[str, Any]]) -> None:
+    """Hash and insert queued events as one chain segment in one transaction."""
+    from app.db.session import get_session_factory
+
+    async with _get_lock():
+        async with get_session_factory()() as db:
+            prev_hash = await _get_last_hash(db)
+            rows = []
+            last_created: datetime | None = None
+            for pending in batch:
+                # Timestamps are assigned here, under the lock, so created_at
+                # order matches chain order; bump ties so the order is strict
+                created_at = datetime.now(UTC)
+                if last_created is not None and created_at <= last_created:
+                    created_at = last_created + timedelta(microseconds=1)
+                event_hash = _compute_event_hash(
+                    event_type=pending["event_type"],
+                    actor_id=pending["actor_id"],
+                    entity_type=pending["entity_type"],
+                    entity_id=pending["entity_id"],
+                    payload_json=pending["payload_json"],
+                    created_at=created_at,
+                    prev_hash=prev_hash,
+                )
+                rows.append(
+                    {
+                        **pending,
+                        "created_at": created_at,
+                        "event_hash": event_hash,
+                        "prev_hash": prev_hash,
+                    }
+                )
+                prev_hash = event_hash
+                last_created = created_at
+            await db.execute(insert(AuditEvent), rows)
+            await db.commit()
+    _log.debug("audit_batch_written", count=len(rows), last_hash=prev_hash)
+
+
+async def _run_writer(queue: asyncio.Queue[dict[str, Any]]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _WRITE_BATCH_WINDOW_S
+        while len(batch) < _WRITE_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+        try:
+            await _write_with_retry(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _write_with_retry(batch: list[dict[str, Any]]) -> None:
+    """
+    Write a batch, retrying transient failures.
+
+    If the batch still fails, its events are written one at a time so a
+    single bad event cannot take the rest down with it; any event that
+    cannot be written is logged in full rather than silently lost.
+    """
+    for attempt in range(1, _WRITE_RETRIES + 1):
+        try:
+            await _write_batch(batch)
+            return
+        except Exception as exc:
+            _log.warning(
+                "audit_batch_write_failed", count=len(batch), attempt=attempt, error=str(exc)
+            )
+            await asyncio.sleep(_WRITE_RETRY_DELAY_S * attempt)
+
+    for item in batch:
+        try:
+            await _write_batch([item])
+        except Exception as exc:
+            _log.error("audit_event_dropped", audit_event=item, error=str(exc))
+
+
+def start_writer() -> None:
+    """Start the background writer; :func:`log` queues events from now on."""
+    global _queue, _writer
+    if _writer is not None:
+        return
+    _queue = asyncio.Queue()
+    _writer = asyncio.create_task(_run_writer(_queue), name="audit-writer")
+
+
+async def stop_writer() -> None:
+    """Write out every queued event, then stop the background writer."""
+    global _queue, _writer
+    if _writer is None or _queue is None:
+        return
+    queue, writer = _queue, _writer
+    # Later log() calls write synchronously again
+    _queue = _writer = None
+    await queue.join()
+    writer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await writer
+
+
+async def flush() -> None:
+    """Wait until every event queued so far has been written."""
+    if _queue is not None:
+        await _queue.join()
+
+
+def _pending_last_hash(db: AsyncSession) -> str | None:
+    """Hash of the newest audit event added to ``db`` but not yet flushed."""
+    pending = [obj for obj in db.new if isinstance(obj, AuditEvent)]
+    if not pending:
+        return None
+    return max(pending, key=lambda e: e.created_at).event_hash
+
+
+async def _get_last_hash(db: AsyncSession) -> str | None:
+    """Fetch the event_hash of the most recently written audit event."""
+    result = await db.execute(
+        select(AuditEvent.event_hash)
+        .order_by(AuditEvent.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def verify_chain(db: AsyncSession) -> tuple[bool, str | None]:
+    """
+    Verify the integrity of the audit hash chain.
+
+    Returns:
+        (True, None) if chain is intact.
+        (False, event_id) of the first event where the chain is broken.
+    """
+    # Stream results in fixed-size batches so memory stays O(batch)
+    # regardless of how large the audit table grows.
+    result = await db.stream_scalars(
+        select(AuditEvent)
+        .order_by(AuditEvent.created_at.asc())
+        .execution_options(yield_per=_VERIFY_BATCH_SIZE)
+    )
+
+    prev_hash: str | None = None
+    try:
+        async for event in result:
+            if event.prev_hash != prev_hash:
+                _log.error(
+                    "audit_chain_link_broken",
+                    event_id=event.id,
+                    expected_prev_hash=prev_hash,
+                    stored_prev_hash=event.prev_hash,
+                )
+                return False, event.id
 
-        prev_hash: str | None = None
-        async for event in result.scalars():
             expected = _compute_event_hash(
                 event_type=event.event_type,
                 actor_id=event.actor_id,
@@ -176,5 +409,24 @@ class AuditLogger:
                 return False, event.id
 
             prev_hash = event.event_hash
+    finally:
+        await result.close()
+
+    return True, None
+
+
+class AuditLogger:
+    """
+    Session-bound facade over :func:`log` and :func:`verify_chain`.
+
+    Kept for callers that hold a session object; new code should call the
+    module functions directly.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def log(self, event_type: str, **kwargs: Any) -> AuditEvent | None:
+        return await log(self._db, event_type=event_type, **kwargs)
 
-        return True, None
+    verify_chain = staticmethod(verify_chain)
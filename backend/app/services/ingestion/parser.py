@@ -14,6 +14,7 @@ Responsible for:
 from __future__ import annotations
 
 import hashlib
+import uuid
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +25,7 @@ from app.core.errors import (
     ValidationError,
 )
 from app.db.models.document import Document, DocumentStatus, Section, SectionType
+from app.db.session import bulk_insert
 from app.services.ingestion.docx_extractor import ExtractedParagraph, extract_docx
 from app.services.ingestion.pdf_extractor import extract_pdf
 from app.services.ingestion.structure_detector import StructuredSection, detect_structure
@@ -158,9 +160,9 @@ class DocumentProcessor:
                         rules_list = []
                         
                         try:
-                            from app.services.llm.client import OllamaClient
+                            from app.services.llm.client import get_ollama_client
                             
-                            client = OllamaClient()
+                            client = get_ollama_client()
                             system_prompt = (
                                 "You are a professional AI assistant that converts document review comments into a formal Ruleset JSON.\n"
                                 "You will be given a list of comments and their context paragraphs.\n"
@@ -294,29 +296,33 @@ class DocumentProcessor:
 
         Heading sections are used to assign parent_id to subsequent
         non-heading sections, building a simple two-level hierarchy.
+        Ids are assigned here so children can reference their heading, and
+        all rows go out in one batched insert.
         """
         current_heading_id: str | None = None
+        rows: list[dict[str, object]] = []
 
         for seq_no, s in enumerate(structured, start=1):
-            section = Section(
-                document_id=document.id,
-                sequence_no=seq_no,
-                section_type=s.section_type,
-                heading=s.heading,
-                original_text=s.text,
-                content_hash=_text_hash(s.text),
-                depth=s.depth,
-                char_count=len(s.text),
-            )
-
+            section_id = str(uuid.uuid4())
             if s.section_type == SectionType.HEADING:
-                section.parent_id = None
-                current_heading_id = None  # will be set after flush
+                parent_id = None
+                current_heading_id = section_id
             else:
-                section.parent_id = current_heading_id
-
-            self._db.add(section)
-            await self._db.flush()
+                parent_id = current_heading_id
+
+            rows.append(
+                {
+                    "id": section_id,
+                    "document_id": document.id,
+                    "parent_id": parent_id,
+                    "sequence_no": seq_no,
+                    "section_type": s.section_type,
+                    "heading": s.heading,
+                    "original_text": s.text,
+                    "content_hash": _text_hash(s.text),
+                    "depth": s.depth,
+                    "char_count": len(s.text),
+                }
+            )
 
-            if s.section_type == SectionType.HEADING:
-                current_heading_id = section.id
+        await bulk_insert(self._db, Section, rows)
@@ -90,6 +90,9 @@ class OllamaResponse:
 
 # ── Client ────────────────────────────────────────────────────────────── #
 
+# How long a health_check() result is served before Ollama is probed again
+_HEALTH_TTL_SECONDS = 5.0
+
 
 class OllamaClient:
     """
@@ -110,7 +113,12 @@ class OllamaClient:
         )
         self._base_url = str(self._settings.ollama_base_url).rstrip("/")
         self._client = AsyncClient(host=self._base_url)
+        # Pooled connections for the OpenAI-compatible /v1 fallback
+        self._http = httpx.AsyncClient(timeout=self._settings.ollama_timeout_seconds)
         self._resolved_model: str | None = None
+        # (monotonic timestamp, result) of the last health probe
+        self._health: tuple[float, bool] = (0.0, False)
+        self._health_lock = asyncio.Lock()
 
     def _make_payload(self, system: str, user: str, stream: bool) -> dict[str, Any]:
         return {
@@ -140,6 +148,13 @@ class OllamaClient:
             return str(chat_response.get("message", {}).get("content", ""))
         return ""
 
+    async def aclose(self) -> None:
+        """Close the pooled connections of both the ollama and /v1 HTTP clients."""
+        try:
+            await self._client.close()  # type: ignore[no-untyped-call]
+        finally:
+            await self._http.aclose()
+
     async def _v1_chat_completion(self, system_prompt: str, user_prompt: str) -> str:
         model_name = await self._resolve_model_name()
         payload = {
@@ -152,14 +167,13 @@ class OllamaClient:
             "temperature": self._settings.rewrite_temperature,
             "max_tokens": self._settings.chunk_max_tokens,
         }
-        async with httpx.AsyncClient(timeout=self._settings.ollama_timeout_seconds) as client:
-            resp = await client.post(f"{self._base_url}/v1/chat/completions", json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            choices = data.get("choices", [])
-            if not choices:
-                return ""
-            return str(choices[0].get("message", {}).get("content", ""))
+        resp = await self._http.post(f"{self._base_url}/v1/chat/completions", json=payload)
+        resp.raise_for_status()
+        data = resp.json()
+        choices = data.get("choices", [])
+        if not choices:
+            return ""
+        return str(choices[0].get("message", {}).get("content", ""))
 
     async def _resolve_model_name(self) -> str:
         if self._resolved_model:
@@ -187,7 +201,25 @@ class OllamaClient:
         return configured
 
     async def health_check(self) -> bool:
-        """Return True if Ollama is reachable, model exists, and a generation endpoint is usable."""
+        """
+        Return True if Ollama is reachable, model exists, and a generation endpoint is usable.
+
+        The result is reused for ``_HEALTH_TTL_SECONDS``; concurrent callers
+        wait on a single in-flight probe rather than each sending their own.
+        """
+        checked_at, healthy = self._health
+        if time.monotonic() - checked_at < _HEALTH_TTL_SECONDS:
+            return healthy
+        async with self._health_lock:
+            # Another caller may have refreshed it while we waited
+            checked_at, healthy = self._health
+            if time.monotonic() - checked_at < _HEALTH_TTL_SECONDS:
+                return healthy
+            healthy = await self._probe_health()
+            self._health = (time.monotonic(), healthy)
+            return healthy
+
+    async def _probe_health(self) -> bool:
         try:
             list_response = await self._client.list()
             models = [m.model for m in getattr(list_response, "models", [])]
@@ -426,3 +458,11 @@ def get_ollama_client() -> OllamaClient:
     if _singleton is None:
         _singleton = OllamaClient()
     return _singleton
+
+
+async def close_ollama_client() -> None:
+    """Close the singleton's pooled HTTP connections (called on shutdown)."""
+    global _singleton
+    if _singleton is not None:
+        client, _singleton = _singleton, None
+        await client.aclose()
@@ -5,7 +5,10 @@ Processes sections in topological (sequence) order, streams tokens
 over WebSocket, and stores results to the database.
 
 Each section is committed atomically with the job progress counter so
-that a WebSocket disconnect never loses completed work.  Failed
+that a WebSocket disconnect never loses completed work.  Database work is
+done in short transactions on sessions taken from the pool only for that
+step; no connection is held while the LLM streams, so the number of
+concurrent jobs is not bounded by the pool size.  Failed
 sections are retried up to ``settings.rewrite_max_attempts`` times
 with exponential back-off before being marked FAILED.
 """
@@ -18,13 +21,15 @@ import time
 from collections.abc import AsyncIterator
 
 import structlog
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
 
 from app.config.settings import get_settings
 from app.db.models.document import Section
 from app.db.models.job import JobStatus, RewriteJob, RewriteStatus, SectionRewrite
 from app.db.models.ruleset import Ruleset
+from app.db.session import get_session_factory
 from app.schemas.job import JobProgressUpdate
 from app.services.llm.client import get_ollama_client
 from app.services.llm.prompt_engine import PromptEngine
@@ -53,18 +58,29 @@ class RewriteOrchestrator:
     Orchestrates the full rewrite pipeline for a single RewriteJob.
 
     Usage:
-        orch = RewriteOrchestrator(db)
+        orch = RewriteOrchestrator()
         async for update in orch.run(job_id):
-            await websocket.send_json(update.model_dump())
+            await websocket.send_text(update.model_dump_json())
+
+    The job, ruleset and rewrites are loaded once and then carried as
+    detached objects (sessions are built with ``expire_on_commit=False``);
+    each unit of work re-attaches what it changes to a fresh session and
+    commits it.
     """
 
-    def __init__(self, db: AsyncSession) -> None:
-        self._db = db
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+        self._session_factory = session_factory or get_session_factory()
         self._settings = get_settings()
         self._llm = get_ollama_client()
         self._prompt_engine = PromptEngine()
         self._risk_analyzer = RiskAnalyzer()
 
+    async def _save(self, *objects: object) -> None:
+        """Commit pending changes on detached ``objects`` in a short transaction."""
+        async with self._session_factory() as db:
+            db.add_all(objects)
+            await db.commit()
+
     async def run(self, job_id: str) -> AsyncIterator[JobProgressUpdate]:
         """
         Execute all pending section rewrites for the job.
@@ -77,30 +93,35 @@ class RewriteOrchestrator:
         """
         log = _log.bind(job_id=job_id)
 
-        job = await self._db.get(RewriteJob, job_id)
-        if job is None or job.status not in (JobStatus.PENDING, JobStatus.PAUSED):
-            return
+        async with self._session_factory() as db:
+            job = await db.get(RewriteJob, job_id)
+            if job is None or job.status not in (JobStatus.PENDING, JobStatus.PAUSED):
+                return
 
-        ruleset = await self._db.get(Ruleset, job.ruleset_id)
-        if ruleset is None:
-            await self._fail_job(job, "Ruleset not found")
-            return
+            ruleset = await db.get(Ruleset, job.ruleset_id)
+            if ruleset is None:
+                job.status = JobStatus.FAILED
+                job.error_message = "Ruleset not found"
+                await db.commit()
+                return
 
-        # Fetch all pending rewrites in sequence order
-        result = await self._db.execute(
-            select(SectionRewrite)
-            .join(Section, Section.id == SectionRewrite.section_id)
-            .where(
-                SectionRewrite.job_id == job_id,
-                SectionRewrite.status == RewriteStatus.PENDING,
+            # Fetch all pending rewrites in sequence order, with their
+            # sections, so nothing needs loading once detached
+            result = await db.execute(
+                select(SectionRewrite)
+                .join(Section, Section.id == SectionRewrite.section_id)
+                .where(
+                    SectionRewrite.job_id == job_id,
+                    SectionRewrite.status == RewriteStatus.PENDING,
+                )
+                .order_by(Section.sequence_no)
+                .options(selectinload(SectionRewrite.section))
             )
-            .order_by(Section.sequence_no)
-        )
-        pending: list[SectionRewrite] = list(result.scalars().all())
+            pending: list[SectionRewrite] = list(result.scalars().all())
 
-        # Mark RUNNING and commit immediately so the UI reflects the state
-        job.status = JobStatus.RUNNING
-        await self._db.commit()
+            # Mark RUNNING and commit immediately so the UI reflects the state
+            job.status = JobStatus.RUNNING
+            await db.commit()
 
         log.info("job_started", pending_rewrites=len(pending))
 
@@ -112,41 +133,40 @@ class RewriteOrchestrator:
                 _clear_cancellation(job_id)
                 job.status = JobStatus.CANCELLED
                 job.error_message = "Job was stopped by user."
-                await self._db.commit()
+                await self._save(job)
                 log.info("job_cancelled_by_user")
                 return
 
             async for update in self._process_rewrite(
-                rewrite, ruleset, total, job.completed_sections or 0
+                job, rewrite, ruleset, total, job.completed_sections or 0
             ):
                 yield update
 
-            # Atomically commit section outcome + updated job counter
-            if rewrite.status in (RewriteStatus.COMPLETED, RewriteStatus.SKIPPED):
-                job.completed_sections = (job.completed_sections or 0) + 1
-            await self._db.commit()
-
         # Determine and persist final job status
-        failure_result = await self._db.execute(
-            select(SectionRewrite).where(
-                SectionRewrite.job_id == job_id,
-                SectionRewrite.status == RewriteStatus.FAILED,
-            )
-        )
-        failures = list(failure_result.scalars().all())
+        async with self._session_factory() as db:
+            failures = (
+                await db.execute(
+                    select(func.count()).select_from(SectionRewrite).where(
+                        SectionRewrite.job_id == job_id,
+                        SectionRewrite.status == RewriteStatus.FAILED,
+                    )
+                )
+            ).scalar_one()
 
-        if failures:
-            job.status = JobStatus.FAILED
-            job.error_message = f"{len(failures)} section(s) failed to rewrite."
-        else:
-            job.status = JobStatus.COMPLETED
+            db.add(job)
+            if failures:
+                job.status = JobStatus.FAILED
+                job.error_message = f"{failures} section(s) failed to rewrite."
+            else:
+                job.status = JobStatus.COMPLETED
+            await db.commit()
 
-        await self._db.commit()
         _clear_cancellation(job_id)
         log.info("job_finished", status=job.status)
 
     async def _process_rewrite(
         self,
+        job: RewriteJob,
         rewrite: SectionRewrite,
         ruleset: Ruleset,
         total_sections: int = 0,
@@ -156,13 +176,14 @@ class RewriteOrchestrator:
         Process a single SectionRewrite with per-attempt retry logic.
 
         Retries up to ``settings.rewrite_max_attempts`` times on failure,
-        using exponential back-off between attempts.  The caller is
-        responsible for committing after this generator is exhausted.
+        using exponential back-off between attempts.  The section outcome
+        is committed together with the job's completed_sections counter.
         """
-        section = await self._db.get(Section, rewrite.section_id)
+        section = rewrite.section
         if section is None:
             rewrite.status = RewriteStatus.SKIPPED
-            await self._db.flush()
+            job.completed_sections = (job.completed_sections or 0) + 1
+            await self._save(rewrite, job)
             return
 
         log = _log.bind(rewrite_id=rewrite.id, section_id=rewrite.section_id)
@@ -173,7 +194,6 @@ class RewriteOrchestrator:
             rewrite.attempt_number = attempt
             rewrite.status = RewriteStatus.RUNNING
             rewrite.error_message = None
-            await self._db.flush()
 
             yield JobProgressUpdate(
                 job_id=rewrite.job_id,
@@ -197,7 +217,7 @@ class RewriteOrchestrator:
                 rewrite.prompt_hash = compiled.prompt_hash
                 rewrite.prompt_text = json.dumps(compiled.to_dict())[:65000]
                 rewrite.model_name = self._settings.ollama_model
-                await self._db.flush()
+                await self._save(rewrite)
 
                 # ── Stream LLM response ───────────────────────────────────────────── #
                 start_ms = int(time.monotonic() * 1000)
@@ -231,19 +251,21 @@ class RewriteOrchestrator:
 
                 end_ms = int(time.monotonic() * 1000)
 
-                rewrite.rewritten_text = clean_text
-                rewrite.tokens_completion = token_count
-                rewrite.duration_ms = end_ms - start_ms
-                rewrite.status = RewriteStatus.COMPLETED
-                await self._db.flush()
-
-                # ── Risk analysis ─────────────────────────────────────────────────── #
-                await self._risk_analyzer.analyze(
-                    db=self._db,
-                    rewrite=rewrite,
-                    original_text=section.original_text,
-                    rewritten_text=clean_text,
-                )
+                # ── Persist result, risk findings and job counter together ──── #
+                async with self._session_factory() as db:
+                    db.add_all((rewrite, job))
+                    rewrite.rewritten_text = clean_text
+                    rewrite.tokens_completion = token_count
+                    rewrite.duration_ms = end_ms - start_ms
+                    rewrite.status = RewriteStatus.COMPLETED
+                    await self._risk_analyzer.analyze(
+                        db=db,
+                        rewrite=rewrite,
+                        original_text=section.original_text,
+                        rewritten_text=clean_text,
+                    )
+                    job.completed_sections = (job.completed_sections or 0) + 1
+                    await db.commit()
 
                 log.info(
                     "rewrite_complete",
@@ -274,7 +296,7 @@ class RewriteOrchestrator:
                     rewrite.error_message = (
                         f"Attempt {attempt} failed, retrying: {str(exc)[:500]}"
                     )
-                    await self._db.flush()
+                    await self._save(rewrite)
                     # Exponential back-off: 2s, 4s, 8s …
                     await asyncio.sleep(2 ** (attempt - 1))
                     continue
@@ -283,7 +305,7 @@ class RewriteOrchestrator:
                 log.error("rewrite_failed_all_attempts", error=str(exc))
                 rewrite.status = RewriteStatus.FAILED
                 rewrite.error_message = str(exc)[:1000]
-                await self._db.flush()
+                await self._save(rewrite)
 
                 yield JobProgressUpdate(
                     job_id=rewrite.job_id,
@@ -294,8 +316,3 @@ class RewriteOrchestrator:
                     total_sections=total_sections,
                     attempt=attempt,
                 )
-
-    async def _fail_job(self, job: RewriteJob, message: str) -> None:
-        job.status = JobStatus.FAILED
-        job.error_message = message
-        await self._db.commit()
@@ -1,16 +1,25 @@
 """
 Diff service: generates structured word-level diffs between original and rewritten text.
 
-Uses difflib SequenceMatcher for O(n) performance on typical legal clause lengths.
+Uses difflib SequenceMatcher on the span between the common prefix and suffix,
+which keeps long clauses with local edits cheap.
 Output is serializable to JSON and used in the review UI.
 """
 
 from __future__ import annotations
 
 import difflib
-import json
+import hashlib
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+
+from pydantic import TypeAdapter
+
+from app.core.cache import TTLCache
+
+# Serialized diffs keyed by digests of both texts; the key is the content,
+# so entries never go stale and the TTL only bounds how long they linger
+_diff_json_cache: TTLCache[bytes, str] = TTLCache(maxsize=512, ttl=3600)
 
 
 @dataclass
@@ -23,6 +32,10 @@ class DiffHunk:
     rewritten: str
 
 
+# (De)serializes hunks in pydantic-core, without an asdict() copy of each one
+_hunk_list = TypeAdapter(list[DiffHunk])
+
+
 def _word_tokenize(text: str) -> list[str]:
     """
     Split text into a token stream for word-level diffing.
@@ -42,14 +55,40 @@ def generate_diff(original: str, rewritten: str) -> list[DiffHunk]:
     orig_tokens = _word_tokenize(original)
     new_tokens = _word_tokenize(rewritten)
 
-    matcher = difflib.SequenceMatcher(
-        isjunk=None, a=orig_tokens, b=new_tokens, autojunk=False
-    )
+    # Rewrites usually change a small part of a long clause. Matching tokens
+    # at either end are emitted as equal hunks directly and only the middle
+    # goes through SequenceMatcher, whose cost grows much faster than length
+    limit = min(len(orig_tokens), len(new_tokens))
+    head = 0
+    while head < limit and orig_tokens[head] == new_tokens[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and orig_tokens[-1 - tail] == new_tokens[-1 - tail]:
+        tail += 1
+    orig_end = len(orig_tokens) - tail
+    new_end = len(new_tokens) - tail
+
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    if head:
+        opcodes.append(("equal", 0, head, 0, head))
+    if head < orig_end or head < new_end:
+        matcher = difflib.SequenceMatcher(
+            isjunk=None,
+            a=orig_tokens[head:orig_end],
+            b=new_tokens[head:new_end],
+            autojunk=False,
+        )
+        opcodes.extend(
+            (opcode, a0 + head, a1 + head, b0 + head, b1 + head)
+            for opcode, a0, a1, b0, b1 in matcher.get_opcodes()
+        )
+    if tail:
+        opcodes.append(("equal", orig_end, len(orig_tokens), new_end, len(new_tokens)))
 
     hunks: list[DiffHunk] = []
     index = 0
 
-    for opcode, a0, a1, b0, b1 in matcher.get_opcodes():
+    for opcode, a0, a1, b0, b1 in opcodes:
         original_chunk = "".join(orig_tokens[a0:a1])
         rewritten_chunk = "".join(new_tokens[b0:b1])
 
@@ -68,12 +107,30 @@ def generate_diff(original: str, rewritten: str) -> list[DiffHunk]:
 
 def diff_to_json(hunks: list[DiffHunk]) -> str:
     """Serialise diff hunks to a compact JSON string for DB storage."""
-    return json.dumps([asdict(h) for h in hunks], ensure_ascii=False)
+    return _hunk_list.dump_json(hunks).decode()
+
+
+def generate_diff_json(original: str, rewritten: str) -> str:
+    """
+    Return ``diff_to_json(generate_diff(original, rewritten))``, memoized.
+
+    A review that is reopened, re-edited or re-run usually diffs a pair it
+    has diffed before; those repeats skip the diff and serialization.
+    """
+    key = (
+        hashlib.blake2b(original.encode(), digest_size=16).digest()
+        + hashlib.blake2b(rewritten.encode(), digest_size=16).digest()
+    )
+    cached = _diff_json_cache.get(key)
+    if cached is None:
+        cached = diff_to_json(generate_diff(original, rewritten))
+        _diff_json_cache.set(key, cached)
+    return cached
 
 
 def json_to_diff(raw: str) -> list[DiffHunk]:
     """Deserialise a JSON diff string back to DiffHunk objects."""
-    return [DiffHunk(**h) for h in json.loads(raw)]
+    return _hunk_list.validate_json(raw)
 
 
 def has_changes(hunks: list[DiffHunk]) -> bool:
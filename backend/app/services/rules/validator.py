@@ -115,10 +115,14 @@ def load_ruleset_from_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
+def canonical_json(data: Any) -> str:
+    """Serialize ``data`` in the canonical form hashed by compute_rules_hash."""
+    return json.dumps(data, sort_keys=True, ensure_ascii=True)
+
+
 def compute_rules_hash(rules_data: dict[str, Any]) -> str:
     """Compute a deterministic SHA-256 hash over the canonical JSON form."""
-    canonical = json.dumps(rules_data, sort_keys=True, ensure_ascii=True)
-    return hashlib.sha256(canonical.encode()).hexdigest()
+    return hashlib.sha256(canonical_json(rules_data).encode()).hexdigest()
 
 
 def detect_rule_conflicts(rules: list[dict[str, Any]]) -> list[dict[str, str]]:
@@ -130,40 +134,49 @@ def detect_rule_conflicts(rules: list[dict[str, Any]]) -> list[dict[str, str]]:
 
     Returns a list of conflict dicts with keys rule_a_id, rule_b_id, description.
     """
-    conflicts: list[dict[str, str]] = []
-    seen: dict[frozenset[str], str] = {}  # scope_key -> rule_id
-
+    # Per-rule inputs as parallel lists, computed once: the pairwise scan
+    # then compares scope sets and precomputed keyword flags only
+    rule_ids: list[str] = [rule["id"] for rule in rules]
+    scopes: list[frozenset[str]] = [frozenset(rule.get("scope", [])) for rule in rules]
+    keyword_flags: list[tuple[tuple[bool, bool], ...]] = []
     for rule in rules:
-        scope: frozenset[str] = frozenset(rule.get("scope", []))
-        rule_id: str = rule["id"]
         prompt: str = (rule.get("prompt_fragment") or rule.get("instruction") or "").lower()
+        keyword_flags.append(
+            tuple(
+                (any(w in prompt for w in pos_words), any(w in prompt for w in neg_words))
+                for pos_words, neg_words in _NEGATION_PAIRS
+            )
+        )
+    # A repeated id resolves to its first rule
+    first_index: dict[str, int] = {}
+    for i, rule_id in enumerate(rule_ids):
+        first_index.setdefault(rule_id, i)
+
+    conflicts: list[dict[str, str]] = []
+    seen: dict[frozenset[str], str] = {}  # scope_key -> rule_id
 
+    for scope, rule_id, flags in zip(scopes, rule_ids, keyword_flags, strict=True):
         for prev_scope_key, prev_rule_id in seen.items():
-            if not scope.isdisjoint(prev_scope_key):
-                prev_rule = next((r for r in rules if r["id"] == prev_rule_id), None)
-                if prev_rule is None:
-                    continue
-                prev_prompt = (prev_rule.get("prompt_fragment") or prev_rule.get("instruction") or "").lower()
-
-                for pos_words, neg_words in _NEGATION_PAIRS:
-                    curr_pos = any(w in prompt for w in pos_words)
-                    curr_neg = any(w in prompt for w in neg_words)
-                    prev_pos = any(w in prev_prompt for w in pos_words)
-                    prev_neg = any(w in prev_prompt for w in neg_words)
-
-                    if (curr_pos and prev_neg) or (curr_neg and prev_pos):
-                        conflicts.append(
-                            {
-                                "rule_a_id": prev_rule_id,
-                                "rule_b_id": rule_id,
-                                "description": (
-                                    f"Rules '{prev_rule_id}' and '{rule_id}' apply to "
-                                    f"overlapping scopes {scope & prev_scope_key} "
-                                    f"but appear to give contradictory instructions."
-                                ),
-                            }
-                        )
-                        break
+            if scope.isdisjoint(prev_scope_key):
+                continue
+            prev_flags = keyword_flags[first_index[prev_rule_id]]
+
+            for (curr_pos, curr_neg), (prev_pos, prev_neg) in zip(
+                flags, prev_flags, strict=True
+            ):
+                if (curr_pos and prev_neg) or (curr_neg and prev_pos):
+                    conflicts.append(
+                        {
+                            "rule_a_id": prev_rule_id,
+                            "rule_b_id": rule_id,
+                            "description": (
+                                f"Rules '{prev_rule_id}' and '{rule_id}' apply to "
+                                f"overlapping scopes {scope & prev_scope_key} "
+                                f"but appear to give contradictory instructions."
+                            ),
+                        }
+                    )
+                    break
 
         seen[scope] = rule_id
 
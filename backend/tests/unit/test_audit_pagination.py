@@ -0,0 +1,78 @@
+"""Unit tests for cursor pagination in app.api.v1.audit."""
+import base64
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.db.models  # noqa: F401  (register every table on Base.metadata)
+from app.api.v1.audit import _decode_cursor, list_audit_events
+from app.core.errors import ValidationError
+from app.db.base import Base
+from app.db.models.audit import AuditEvent
+
+_CREATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+# Shared leading hex digits, so ordering must follow the full uuid
+_IDS = [f"aaaaaaaa-0000-4000-8000-{i:012x}" for i in range(5)]
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+    async with factory() as session:
+        await session.execute(
+            insert(AuditEvent),
+            [
+                {
+                    "id": event_id,
+                    "event_type": "test.event",
+                    "event_hash": f"{i:064x}",
+                    "created_at": _CREATED_AT,
+                    "updated_at": _CREATED_AT,
+                }
+                for i, event_id in enumerate(_IDS)
+            ],
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def _page(db, cursor: str | None):
+    return await list_audit_events(
+        db, page=1, page_size=2, cursor=cursor, event_type=None, entity_id=None, actor_id=None
+    )
+
+
+async def test_cursor_pages_through_events_with_equal_timestamps(db):
+    seen: list[str] = []
+    cursor = None
+    for _ in range(len(_IDS)):
+        response = await _page(db, cursor)
+        seen += [item.id for item in response.items]
+        cursor = response.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == sorted(_IDS, reverse=True)
+
+
+async def test_total_is_counted_on_offset_pages_only(db):
+    first = await _page(db, None)
+    assert first.total == len(_IDS)
+    assert (await _page(db, first.next_cursor)).total is None
+
+
+def _cursor(ts: str, event_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{ts}|{event_id}".encode()).decode()
+
+
+@pytest.mark.parametrize("event_id", ["not-a-uuid", "", "1 OR 1=1"])
+def test_cursor_with_non_uuid_id_is_rejected(event_id):
+    with pytest.raises(ValidationError):
+        _decode_cursor(_cursor(_CREATED_AT.isoformat(), event_id))
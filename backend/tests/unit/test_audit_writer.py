@@ -0,0 +1,186 @@
+"""Unit tests for the background audit writer in app.services.audit.logger."""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.db.models  # noqa: F401  (register every table on Base.metadata)
+from app.db import session as db_session_module
+from app.db.base import Base
+from app.db.models.audit import AuditEvent
+from app.services.audit import logger as audit
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def factory(tmp_path, monkeypatch):
+    """A file-backed SQLite database shared by the test and the writer."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+    monkeypatch.setattr(db_session_module, "_session_factory", session_factory)
+    monkeypatch.setattr(audit, "_LOCK", None)
+    monkeypatch.setattr(audit, "_WRITE_RETRY_DELAY_S", 0)
+    yield session_factory
+    await audit.stop_writer()
+    await engine.dispose()
+
+
+async def _log(db, event_type: str, **kwargs) -> None:
+    await audit.log(db, event_type=event_type, payload={"n": event_type}, **kwargs)
+
+
+async def _event_types(factory) -> list[str]:
+    async with factory() as db:
+        result = await db.scalars(select(AuditEvent.event_type).order_by(AuditEvent.created_at))
+        return list(result)
+
+
+async def _assert_chain_intact(factory) -> None:
+    async with factory() as db:
+        assert await audit.verify_chain(db) == (True, None)
+
+
+async def test_queued_events_are_written_after_commit(factory):
+    audit.start_writer()
+    async with factory() as db:
+        await _log(db, "a")
+        await _log(db, "b")
+        await db.commit()
+    await audit.flush()
+
+    assert await _event_types(factory) == ["a", "b"]
+    await _assert_chain_intact(factory)
+
+
+async def test_rolled_back_events_are_never_written(factory):
+    audit.start_writer()
+    async with factory() as db:
+        await _log(db, "discarded")
+        await db.rollback()
+    async with factory() as db:
+        await _log(db, "kept")
+        await db.commit()
+    await audit.flush()
+
+    assert await _event_types(factory) == ["kept"]
+
+
+async def test_queued_events_in_one_window_share_a_batch(factory, monkeypatch):
+    batches: list[int] = []
+    write_batch = audit._write_batch
+
+    async def counting_write_batch(batch):
+        batches.append(len(batch))
+        await write_batch(batch)
+
+    monkeypatch.setattr(audit, "_write_batch", counting_write_batch)
+    audit.start_writer()
+    async with factory() as db:
+        for i in range(5):
+            await _log(db, f"e{i}")
+        await db.commit()
+    await audit.flush()
+
+    assert batches == [5]
+    await _assert_chain_intact(factory)
+
+
+async def test_durable_event_and_writer_do_not_fork_the_chain(factory):
+    async with factory() as db:
+        await _log(db, "seed")
+        await db.commit()
+
+    audit.start_writer()
+    durable_db = factory()
+    await _log(durable_db, "durable", durable=True)
+
+    async with factory() as db:
+        await _log(db, "queued")
+        await db.commit()
+    flushed = asyncio.create_task(audit.flush())
+    await asyncio.sleep(0.3)
+    # The writer waits for the durable event's transaction to end
+    assert not flushed.done()
+
+    await durable_db.commit()
+    await durable_db.close()
+    await flushed
+
+    assert await _event_types(factory) == ["seed", "durable", "queued"]
+    await _assert_chain_intact(factory)
+
+
+async def test_rolled_back_durable_event_releases_the_chain(factory):
+    async with factory() as db:
+        await _log(db, "durable", durable=True)
+        await db.rollback()
+    async with factory() as db:
+        await _log(db, "next", durable=True)
+        await db.commit()
+
+    assert await _event_types(factory) == ["next"]
+    await _assert_chain_intact(factory)
+
+
+async def test_stop_writer_drains_the_queue_then_writes_inline(factory):
+    audit.start_writer()
+    async with factory() as db:
+        await _log(db, "queued")
+        await db.commit()
+    await audit.stop_writer()
+    assert await _event_types(factory) == ["queued"]
+
+    async with factory() as db:
+        returned = await audit.log(db, event_type="inline")
+        assert returned is not None
+        await db.commit()
+
+    assert await _event_types(factory) == ["queued", "inline"]
+    await _assert_chain_intact(factory)
+
+
+async def test_failed_batch_is_retried(factory, monkeypatch):
+    write_batch = audit._write_batch
+    failures = iter([True])
+
+    async def flaky_write_batch(batch):
+        if next(failures, False):
+            raise RuntimeError("database unavailable")
+        await write_batch(batch)
+
+    monkeypatch.setattr(audit, "_write_batch", flaky_write_batch)
+    audit.start_writer()
+    async with factory() as db:
+        await _log(db, "a")
+        await _log(db, "b")
+        await db.commit()
+    await audit.flush()
+
+    assert await _event_types(factory) == ["a", "b"]
+
+
+async def test_bad_event_does_not_drop_the_rest_of_its_batch(factory, monkeypatch):
+    write_batch = audit._write_batch
+
+    async def poisoned_write_batch(batch):
+        if any(item["event_type"] == "bad" for item in batch):
+            raise RuntimeError("cannot insert")
+        await write_batch(batch)
+
+    monkeypatch.setattr(audit, "_write_batch", poisoned_write_batch)
+    audit.start_writer()
+    async with factory() as db:
+        for event_type in ("a", "bad", "b"):
+            await _log(db, event_type)
+        await db.commit()
+    await audit.flush()
+
+    assert await _event_types(factory) == ["a", "b"]
+    async with factory() as db:
+        assert await db.scalar(select(func.count()).select_from(AuditEvent)) == 2
+    await _assert_chain_intact(factory)
@@ -0,0 +1,42 @@
+"""Unit tests for app.core.cache."""
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=30)
+    cache.set("a", 1)
+    now[0] += 29
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.get("a") is None
@@ -5,6 +5,7 @@ from app.services.review.diff import (
     DiffHunk,
     diff_to_json,
     generate_diff,
+    generate_diff_json,
     json_to_diff,
 )
 
@@ -71,6 +72,16 @@ def test_serialization_roundtrip():
         assert orig_h.end_char == rest_h.end_char
 
 
+def test_generate_diff_json_matches_uncached():
+    original = "The party agrees to pay fifty thousand dollars."
+    rewritten = "The party shall pay USD 50,000."
+    expected = diff_to_json(generate_diff(original, rewritten))
+    assert generate_diff_json(original, rewritten) == expected
+    # Served from the cache the second time, same result
+    assert generate_diff_json(original, rewritten) == expected
+    assert generate_diff_json(rewritten, original) != expected
+
+
 def test_coverage_contiguous():
     """All characters in the original should be covered by hunks exactly once."""
     original = "Clause 1. The vendor shall deliver the goods by 31 December."
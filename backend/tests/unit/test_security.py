@@ -2,7 +2,7 @@
 from datetime import timedelta
 
 import pytest
-from jose import jwt
+import jwt
 
 from app.config.settings import get_settings
 from app.core.security import (
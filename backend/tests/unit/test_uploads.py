@@ -0,0 +1,133 @@
+"""Unit tests for app.core.uploads (streaming multipart receiver)."""
+import hashlib
+
+import pytest
+from starlette.requests import Request
+
+from app.core.errors import PayloadTooLargeError, ValidationError
+from app.core.uploads import receive_file_upload
+
+pytestmark = pytest.mark.asyncio
+
+_BOUNDARY = "testboundary"
+_CONTENT_TYPE = f"multipart/form-data; boundary={_BOUNDARY}"
+
+
+def _part(name: str, data: bytes, filename: str | None = None, content_type: str = "") -> bytes:
+    disposition = f'form-data; name="{name}"'
+    if filename is not None:
+        disposition += f'; filename="{filename}"'
+    headers = f"Content-Disposition: {disposition}\r\n"
+    if content_type:
+        headers += f"Content-Type: {content_type}\r\n"
+    return f"--{_BOUNDARY}\r\n{headers}\r\n".encode() + data + b"\r\n"
+
+
+def _body(*parts: bytes) -> bytes:
+    return b"".join(parts) + f"--{_BOUNDARY}--\r\n".encode()
+
+
+def _request(body: bytes, content_type: str = _CONTENT_TYPE, chunk_size: int = 7) -> Request:
+    """A request whose body arrives in small chunks, as it would off the wire."""
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)] or [b""]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/upload",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+async def test_file_is_streamed_to_dest_and_other_fields_are_ignored(tmp_path):
+    content = b"%PDF-1.7 " + bytes(range(256)) * 40
+    body = _body(
+        _part("title", b"quarterly report"),
+        _part("file", content, filename="report.pdf", content_type="application/pdf"),
+        _part("notes", b"ignored"),
+    )
+    dest = tmp_path / "upload.part"
+
+    received = await receive_file_upload(_request(body), "file", dest, limit_bytes=1 << 20)
+
+    assert dest.read_bytes() == content
+    assert received.filename == "report.pdf"
+    assert received.content_type == "application/pdf"
+    assert received.size_bytes == len(content)
+    assert received.file_hash == hashlib.blake2b(content, digest_size=32).hexdigest()
+
+
+async def test_file_over_the_limit_is_rejected_and_removed(tmp_path):
+    body = _body(_part("file", b"x" * 1000, filename="big.pdf"))
+    dest = tmp_path / "upload.part"
+
+    with pytest.raises(PayloadTooLargeError):
+        await receive_file_upload(_request(body), "file", dest, limit_bytes=999)
+
+    assert not dest.exists()
+
+
+async def test_file_at_the_limit_is_accepted(tmp_path):
+    body = _body(_part("file", b"x" * 1000, filename="exact.pdf"))
+    dest = tmp_path / "upload.part"
+
+    received = await receive_file_upload(_request(body), "file", dest, limit_bytes=1000)
+
+    assert received.size_bytes == 1000
+
+
+async def test_missing_file_field_is_rejected(tmp_path):
+    body = _body(
+        _part("title", b"no file here"),
+        _part("attachment", b"wrong field", filename="other.pdf"),
+    )
+    dest = tmp_path / "upload.part"
+
+    with pytest.raises(ValidationError, match="Missing file field 'file'"):
+        await receive_file_upload(_request(body), "file", dest, limit_bytes=1 << 20)
+
+    assert not dest.exists()
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", "multipart/form-data", "text/plain; boundary=testboundary"],
+)
+async def test_non_multipart_body_is_rejected(tmp_path, content_type):
+    dest = tmp_path / "upload.part"
+
+    with pytest.raises(ValidationError, match="multipart/form-data"):
+        await receive_file_upload(
+            _request(b'{"file": "x"}', content_type=content_type), "file", dest, 1 << 20
+        )
+
+    assert not dest.exists()
+
+
+async def test_truncated_body_is_rejected_and_removed(tmp_path):
+    body = _body(_part("file", b"y" * 500, filename="cut.pdf"))
+    dest = tmp_path / "upload.part"
+
+    with pytest.raises(ValidationError, match="Incomplete"):
+        await receive_file_upload(_request(body[:300]), "file", dest, limit_bytes=1 << 20)
+
+    assert not dest.exists()
+
+
+async def test_malformed_body_is_rejected_and_removed(tmp_path):
+    dest = tmp_path / "upload.part"
+
+    with pytest.raises(ValidationError, match="Malformed"):
+        await receive_file_upload(
+            _request(b"this is not a multipart body"), "file", dest, limit_bytes=1 << 20
+        )
+
+    assert not dest.exists()
@@ -1,14 +1,16 @@
 """Unit tests for app.services.rules.validator."""
+import hashlib
+
 import pytest
 
+from app.services.rules.validator import ValidationError as RulesetValidationError
 from app.services.rules.validator import (
+    canonical_json,
     compute_rules_hash,
     detect_rule_conflicts,
     validate_ruleset_dict,
-    ValidationError as RulesetValidationError,
 )
 
-
 # ─── Minimal valid ruleset fixture ────────────────────────────────────────────
 
 VALID_RULESET = {
@@ -123,6 +125,13 @@ def test_hash_changes_when_rules_change():
     assert compute_rules_hash(rules_v1) != compute_rules_hash(rules_v2)
 
 
+def test_hash_is_over_the_canonical_document():
+    data = {**VALID_RULESET, "name": 'quote " and "rules": null inside'}
+    expected = hashlib.sha256(canonical_json(data).encode()).hexdigest()
+    assert compute_rules_hash(data) == expected
+    assert compute_rules_hash({**data, "name": "renamed"}) != expected
+
+
 # ─── detect_rule_conflicts ────────────────────────────────────────────────────
 
 def test_no_conflict_for_single_rule():
@@ -169,3 +178,13 @@ def test_different_section_types_no_conflict():
     ]
     conflicts = detect_rule_conflicts(rules)
     assert conflicts == []
+
+
+def test_conflict_detected_for_overlapping_scopes():
+    rules = [
+        {"id": "keep", "scope": ["clause", "heading"], "instruction": "Use defined terms."},
+        {"id": "other", "scope": ["table"], "instruction": "Remove footnotes."},
+        {"id": "drop", "scope": ["clause"], "instruction": "Remove defined terms."},
+    ]
+    conflicts = detect_rule_conflicts(rules)
+    assert [(c["rule_a_id"], c["rule_b_id"]) for c in conflicts] == [("keep", "drop")]
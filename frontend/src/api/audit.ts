@@ -5,6 +5,7 @@ export const auditApi = {
   list: (params?: {
     page?: number;
     page_size?: number;
+    cursor?: string;
     actor_id?: string;
     entity_type?: string;
     entity_id?: string;
@@ -253,6 +253,7 @@ export interface AuditListResponse {
   total: number;
   page: number;
   page_size: number;
+  next_cursor: string | null;
 }
 
 export interface ChainVerificationResult {